@@ -10,12 +10,18 @@ W5500_MOSI = const(19)
 W5500_MISO = const(16)
 W5500_CS = const(17)
 W5500_RST = const(20)
+# W5500 tolerates well above this; limited by board routing, not the chip
+W5500_SPI_BAUD = const(30_000_000)
 
 # === I2C Pins ===
 I2C_ID = const(0)
 I2C_SDA = const(0)
 I2C_SCL = const(1)
-I2C_FREQ = const(400000)
+# Fast Mode Plus: SSD1306, ADS1115, TCA9548A and the sensor EEPROMs are
+# all rated for 1 MHz operation. Requires adequately strong pull-ups.
+# Do not drop below 400 kHz (Fast Mode): sensor detection reads ~250
+# header/calibration bytes per channel and is bus-bound.
+I2C_FREQ = const(1000000)
 
 # === Sensor Presence Detect Pins ===
 DETECT_PIN_CH1 = const(2)  # GP2 - Sensor 1 presence detect
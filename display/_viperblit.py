@@ -0,0 +1,28 @@
+# Native glyph blit for the power display
+# Compiled with the MicroPython viper emitter for direct framebuffer
+# writes; power_display.py imports this with a fallback for ports
+# without viper support.
+
+import micropython
+
+# Geometry is fixed: 128-wide, 8-page MONO_VLSB display buffer and
+# 14x16 glyphs (two source pages), matching power_display's glyph cache.
+
+
+@micropython.viper
+def blit_glyph(dest: ptr8, src: ptr8, x: int, y: int):
+    shift = y & 7
+    page = y >> 3
+    for col in range(14):
+        dx = x + col
+        if dx >= 0:
+            if dx < 128:
+                for p in range(2):
+                    b = int(src[p * 14 + col])
+                    if b:
+                        dpage = page + p
+                        i = dpage * 128 + dx
+                        dest[i] = int(dest[i]) | ((b << shift) & 0xFF)
+                        if shift:
+                            if dpage < 7:
+                                dest[i + 128] = int(dest[i + 128]) | (b >> (8 - shift))
@@ -1,32 +1,47 @@
 # Power Display Module
 # Renders power readings on SSD1306 OLED displays
 
+import framebuf
+
 from .ssd1306 import SSD1306_I2C
+from sensors.power_sensor import UNIT_STRINGS
 import config
 
-# Large digit font (16x24 pixels) - simplified bitmap representation
-# Each digit is represented as a list of horizontal lines
-LARGE_DIGITS = {
-    '0': [(2, 12), (0, 14), (0, 14), (0, 14), (0, 14), (0, 14), (2, 12)],
-    '1': [(6, 8), (4, 10), (6, 8), (6, 8), (6, 8), (6, 8), (4, 12)],
-    '2': [(2, 12), (0, 14), (10, 14), (6, 10), (2, 6), (0, 4), (0, 14)],
-    '3': [(2, 12), (0, 14), (10, 14), (6, 12), (10, 14), (0, 14), (2, 12)],
-    '4': [(0, 4), (0, 4), (0, 10), (0, 14), (10, 14), (10, 14), (10, 14)],
-    '5': [(0, 14), (0, 4), (0, 12), (10, 14), (10, 14), (0, 14), (2, 12)],
-    '6': [(4, 12), (2, 6), (0, 4), (0, 12), (0, 14), (0, 14), (2, 12)],
-    '7': [(0, 14), (10, 14), (8, 12), (6, 10), (4, 8), (4, 8), (4, 8)],
-    '8': [(2, 12), (0, 14), (0, 14), (2, 12), (0, 14), (0, 14), (2, 12)],
-    '9': [(2, 12), (0, 14), (0, 14), (2, 14), (10, 14), (8, 12), (2, 10)],
-    '-': [(0, 0), (0, 0), (0, 0), (2, 12), (0, 0), (0, 0), (0, 0)],
-    '.': [(0, 0), (0, 0), (0, 0), (0, 0), (0, 0), (0, 0), (5, 9)],
-    ' ': [(0, 0), (0, 0), (0, 0), (0, 0), (0, 0), (0, 0), (0, 0)],
-}
-
+# Large glyph dimensions (2x the built-in 8x8 font, with 1px bold offset)
+GLYPH_WIDTH = 14
+GLYPH_HEIGHT = 16
+
+# Native glyph blit (viper emitter); fall back to framebuf.blit on
+# ports where the emitter is unavailable.
+try:
+    from ._viperblit import blit_glyph as _blit_glyph
+except Exception:
+    _blit_glyph = None
+
+_POW10 = (1, 10, 100)
+
+
+def _fmt_fixed(value, decimals):
+    """Format a float with a fixed number of decimals via integer math.
+
+    str.format's float path allocates and runs a format mini-parser on
+    every call; this keeps the 5 Hz refresh path on cheap int ops.
+    """
+    n = int(value * _POW10[decimals] + (0.5 if value >= 0 else -0.5))
+    if decimals == 0:
+        return str(n)
+    sign = ""
+    if n < 0:
+        sign = "-"
+        n = -n
+    scale = _POW10[decimals]
+    frac = str(n % scale)
+    return sign + str(n // scale) + "." + "0" * (decimals - len(frac)) + frac
 
 class PowerDisplay:
     """Display power reading on OLED."""
 
-    def __init__(self, i2c, address, channel_num):
+    def __init__(self, i2c, address, channel_num, shared_buffer=None):
         """
         Initialize power display.
 
@@ -34,17 +49,58 @@ class PowerDisplay:
             i2c: I2C bus instance
             address: OLED I2C address
             channel_num: Channel number for labeling
+            shared_buffer: Optional framebuffer shared with other displays
         """
         self.display = SSD1306_I2C(
             config.DISPLAY_WIDTH,
             config.DISPLAY_HEIGHT,
             i2c,
-            address
+            address,
+            shared_buffer=shared_buffer
         )
         self.channel_num = channel_num
         self.last_power = None
         self.last_unit = None
         self.last_sensor = None
+        self._last_tuple = None
+
+        # Fixed/recurring strings, computed once instead of per refresh
+        self._atten_cache = {}
+
+        # Channel label rasterized once into an 8-pixel-high strip;
+        # render blits the strip instead of re-rasterizing the text.
+        self._label_buf = bytearray(24)
+        self._label_fb = framebuf.FrameBuffer(
+            self._label_buf, 24, 8, framebuf.MONO_VLSB
+        )
+        self._label_fb.text("CH{}".format(channel_num), 0, 0, 1)
+
+        # Cross-module const lookups resolve through the module dict at
+        # runtime; cache the width once for the refresh path.
+        self._disp_w = config.DISPLAY_WIDTH
+
+        # Bar graph geometry, fixed for the life of the display
+        self._bar_x = 2
+        self._bar_width = config.DISPLAY_WIDTH - 4
+        self._bar_inner = self._bar_width - 2
+
+        # Prerendered 2x glyphs, built on demand and blitted in one call
+        # each instead of six framebuf.text() passes per character.
+        self._glyph_cache = {}
+        for char in "0123456789.- ":
+            self._make_glyph(char)
+
+    def _make_glyph(self, char):
+        """Build and cache a prerendered 2x-scale glyph for a character."""
+        buf = bytearray(GLYPH_WIDTH * GLYPH_HEIGHT // 8)
+        fb = framebuf.FrameBuffer(buf, GLYPH_WIDTH, GLYPH_HEIGHT, framebuf.MONO_VLSB)
+        # Same six offset passes the old per-character draw used: bold
+        # doubling horizontally/vertically plus a second row at y+8.
+        for dx, dy in ((0, 0), (1, 0), (0, 1), (1, 1), (0, 8), (1, 8)):
+            fb.text(char, dx, dy, 1)
+        glyph = (fb, buf)
+        self._glyph_cache[char] = glyph
+        return glyph
 
     def clear(self):
         """Clear display."""
@@ -54,44 +110,9 @@ class PowerDisplay:
         """Update display."""
         self.display.show()
 
-    def draw_large_number(self, value, x, y, width=80):
-        """
-        Draw a large number for power reading.
-
-        Args:
-            value: Numeric value to display
-            x: X position
-            y: Y position
-            width: Available width
-        """
-        if value is None:
-            text = "---.-"
-        else:
-            # Format to one decimal place
-            if value >= 0:
-                text = "{:5.1f}".format(value)
-            else:
-                text = "{:5.1f}".format(value)
-
-        # Use built-in font at 2x scale (simulated with filled rectangles)
-        # Each character is 8 pixels wide in standard font
-        char_width = 12
-        char_height = 16
-
-        for i, char in enumerate(text.strip()):
-            cx = x + i * char_width
-            # Draw character using 2x2 pixel blocks
-            self._draw_char_large(char, cx, y, 2)
-
-    def _draw_char_large(self, char, x, y, scale=2):
-        """Draw a character at larger scale."""
-        # Use standard 8x8 font, scaled up
-        self.display.text(char, x, y, 1)
-        # For larger text, we draw multiple times offset
-        if scale >= 2:
-            self.display.text(char, x + 1, y, 1)
-            self.display.text(char, x, y + 1, 1)
-            self.display.text(char, x + 1, y + 1, 1)
+    def flush(self):
+        """Transmit the rendered framebuffer (no-op if nothing dirty)."""
+        self.display.show()
 
     def draw_power_bar(self, power_dbm, y, min_dbm=-60, max_dbm=10):
         """
@@ -103,20 +124,23 @@ class PowerDisplay:
             min_dbm: Minimum scale value
             max_dbm: Maximum scale value
         """
-        bar_width = config.DISPLAY_WIDTH - 4
         bar_height = 8
+        fb = self.display.framebuf
 
         # Draw outline
-        self.display.rect(2, y, bar_width, bar_height, 1)
+        fb.rect(self._bar_x, y, self._bar_width, bar_height, 1)
 
         if power_dbm is not None:
             # Calculate fill level
             level = (power_dbm - min_dbm) / (max_dbm - min_dbm)
             level = max(0.0, min(1.0, level))
-            fill_width = int((bar_width - 2) * level)
+            fill_width = int(self._bar_inner * level)
 
             if fill_width > 0:
-                self.display.fill_rect(3, y + 1, fill_width, bar_height - 2, 1)
+                fb.fill_rect(
+                    self._bar_x + 1, y + 1, fill_width, bar_height - 2, 1
+                )
+        self.display._mark_dirty(y, y + bar_height - 1)
 
     def update(self, power_value, unit_str, sensor_type=None, ip_addr=None, attenuator=0.0):
         """
@@ -129,76 +153,115 @@ class PowerDisplay:
             ip_addr: IP address to show
             attenuator: External attenuator value in dB (0 = none)
         """
+        if self.render(power_value, unit_str, sensor_type, ip_addr, attenuator):
+            self.show()
+
+    async def update_async(self, power_value, unit_str, sensor_type=None,
+                           ip_addr=None, attenuator=0.0):
+        """Update display, flushing asynchronously (see show_async)."""
+        if self.render(power_value, unit_str, sensor_type, ip_addr, attenuator):
+            await self.display.show_async()
+
+    def render(self, power_value, unit_str, sensor_type, ip_addr, attenuator):
+        """Render a reading into the framebuffer.
+
+        Returns:
+            True if the framebuffer changed and needs flushing
+        """
+        # Skip redraw and I2C transfer when nothing visible changed.
+        # Quantize to 0.01 dB so sub-resolution noise does not count.
+        q_power = round(power_value, 2) if power_value is not None else None
+        state = (q_power, unit_str, sensor_type, ip_addr, attenuator)
+        if state == self._last_tuple:
+            return False
+
         self.clear()
+        # clear() marks the whole frame dirty, so the raw framebuf
+        # methods can be used here, skipping both the dotted lookups and
+        # the redundant per-call dirty tracking in the driver wrappers.
+        fb = self.display.framebuf
+        text = fb.text
 
-        # Channel label (top left)
-        self.display.text("CH{}".format(self.channel_num), 0, 0, 1)
+        # Channel label (top left), pre-rasterized strip
+        fb.blit(self._label_fb, 0, 0)
 
         # Attenuator indicator (next to channel) if active
         if attenuator != 0.0:
-            atten_str = "+{:.0f}dB".format(attenuator)
-            self.display.text(atten_str, 28, 0, 1)
+            atten_str = self._atten_cache.get(attenuator)
+            if atten_str is None:
+                atten_str = "+{:.0f}dB".format(attenuator)
+                self._atten_cache[attenuator] = atten_str
+            text(atten_str, 28, 0, 1)
 
         # Sensor type (top right)
         if sensor_type:
             sensor_text = sensor_type[:8]  # Truncate if needed
-            x = config.DISPLAY_WIDTH - len(sensor_text) * 8
-            self.display.text(sensor_text, x, 0, 1)
+            x = self._disp_w - len(sensor_text) * 8
+            text(sensor_text, x, 0, 1)
         else:
-            self.display.text("NO SENSOR", 40, 0, 1)
+            text("NO SENSOR", 40, 0, 1)
 
         # Main power reading (large, centered)
         if power_value is not None:
-            # Format power value
-            if abs(power_value) >= 100:
-                power_str = "{:.0f}".format(power_value)
-            elif abs(power_value) >= 10:
-                power_str = "{:.1f}".format(power_value)
-            else:
-                power_str = "{:.2f}".format(power_value)
+            # Format with magnitude-dependent precision (single abs)
+            av = abs(power_value)
+            power_str = _fmt_fixed(
+                power_value, 2 if av < 10 else (1 if av < 100 else 0)
+            )
 
             # Draw large power value
             self._draw_large_text(power_str, 4, 16)
 
             # Unit
-            self.display.text(unit_str, 90, 24, 1)
+            text(unit_str, 90, 24, 1)
 
             # Power bar
             self.draw_power_bar(power_value if unit_str == "dBm" else None, 44)
         else:
             # No sensor connected
             self._draw_large_text("----", 20, 16)
-            self.display.text("NO SENSOR", 24, 40, 1)
+            text("NO SENSOR", 24, 40, 1)
 
         # IP address or status (bottom)
         if ip_addr:
             ip_text = ip_addr[:16]  # Truncate if needed
-            self.display.text(ip_text, 0, 56, 1)
+            text(ip_text, 0, 56, 1)
         else:
-            self.display.text("DHCP...", 0, 56, 1)
-
-        self.show()
+            text("DHCP...", 0, 56, 1)
 
         # Cache values
         self.last_power = power_value
         self.last_unit = unit_str
         self.last_sensor = sensor_type
+        self._last_tuple = state
+        return True
 
     def _draw_large_text(self, text, x, y):
-        """Draw text at 2x scale."""
-        for i, char in enumerate(text):
-            cx = x + i * 14  # 14 pixels per character at 2x
-            # Draw each character 4 times for 2x effect
-            self.display.text(char, cx, y, 1)
-            self.display.text(char, cx + 1, y, 1)
-            self.display.text(char, cx, y + 8, 1)
-            self.display.text(char, cx + 1, y + 8, 1)
-            # Fill in for bolder text
-            self.display.text(char, cx, y + 1, 1)
-            self.display.text(char, cx + 1, y + 1, 1)
+        """Draw text at 2x scale using the prerendered glyph cache."""
+        cache = self._glyph_cache
+        display = self.display
+        if _blit_glyph is not None:
+            # Native path: OR glyph bytes straight into the display
+            # buffer, then mark the touched rows dirty once.
+            buf = display.buffer
+            for i, char in enumerate(text):
+                glyph = cache.get(char)
+                if glyph is None:
+                    glyph = self._make_glyph(char)
+                _blit_glyph(buf, glyph[1], x + i * GLYPH_WIDTH, y)
+            display._mark_dirty(y, y + GLYPH_HEIGHT - 1)
+        else:
+            blit = display.framebuf.blit
+            for i, char in enumerate(text):
+                glyph = cache.get(char)
+                if glyph is None:
+                    glyph = self._make_glyph(char)
+                blit(glyph[0], x + i * GLYPH_WIDTH, y)
+            display._mark_dirty(y, y + GLYPH_HEIGHT - 1)
 
     def show_startup(self):
         """Show startup screen."""
+        self._last_tuple = None  # Force redraw on next update
         self.clear()
         self.display.text("RF Power Meter", 8, 8, 1)
         self.display.text("Channel {}".format(self.channel_num), 32, 24, 1)
@@ -208,21 +271,13 @@ class PowerDisplay:
 
     def show_error(self, message):
         """Show error message."""
+        self._last_tuple = None  # Force redraw on next update
         self.clear()
         self.display.text("ERROR", 44, 16, 1)
-        # Word wrap message
-        words = message.split()
-        line = ""
-        y = 32
-        for word in words:
-            if len(line) + len(word) + 1 <= 16:
-                line += (" " if line else "") + word
-            else:
-                self.display.text(line, 0, y, 1)
-                y += 10
-                line = word
-        if line:
-            self.display.text(line, 0, y, 1)
+        # Wrap by slicing at column 16: unlike word wrap this allocates
+        # no list, which matters when the error is an out-of-memory one.
+        for i in range(0, len(message), 16):
+            self.display.text(message[i:i + 16], 0, 32 + 10 * (i // 16), 1)
         self.show()
 
 
@@ -236,9 +291,14 @@ class DisplayManager:
         Args:
             i2c: I2C bus instance
         """
+        # One framebuffer serves both displays: every render fully
+        # redraws its frame and is flushed before the other channel
+        # renders, so the second 1 KB buffer would never hold anything
+        # the panel RAM doesn't already.
+        shared = bytearray(config.DISPLAY_WIDTH * config.DISPLAY_HEIGHT // 8)
         self.displays = {
-            1: PowerDisplay(i2c, config.OLED_ADDR_CH1, 1),
-            2: PowerDisplay(i2c, config.OLED_ADDR_CH2, 2),
+            1: PowerDisplay(i2c, config.OLED_ADDR_CH1, 1, shared_buffer=shared),
+            2: PowerDisplay(i2c, config.OLED_ADDR_CH2, 2, shared_buffer=shared),
         }
         self.ip_address = None
 
@@ -265,14 +325,46 @@ class DisplayManager:
         Args:
             meter: PowerMeter instance
         """
+        # The framebuffer is shared, so each channel must be rendered
+        # and flushed before the next channel's render overwrites it.
         for ch_num, display in self.displays.items():
-            channel = meter.get_channel(ch_num)
-            if channel:
-                power, unit = channel.get_power()
-                display.update(
-                    power, unit, channel.sensor_type,
-                    self.ip_address, channel.get_attenuator()
-                )
+            if self._render_channel(meter, ch_num, display):
+                display.flush()
+
+    def _render_channel(self, meter, ch_num, display):
+        """Render one channel from the meter's published reading slots.
+
+        Reads one float and one unit id from the meter's arrays instead
+        of calling get_power(), which allocates a tuple per call. NaN
+        marks a channel with no reading.
+
+        Returns:
+            True if the framebuffer changed and needs flushing
+        """
+        channel = meter.get_channel(ch_num)
+        if not channel:
+            return False
+        power = meter._latest_power[ch_num - 1]
+        if power != power:  # NaN
+            power = None
+        return display.render(
+            power, UNIT_STRINGS[meter._latest_unit_id[ch_num - 1]],
+            channel.sensor_type, self.ip_address,
+            channel.get_attenuator()
+        )
+
+    async def update_all_async(self, meter):
+        """
+        Update all displays from power meter, yielding during I2C bursts.
+
+        Args:
+            meter: PowerMeter instance
+        """
+        # Same per-channel render-then-flush as update_all, but the
+        # flushes stream page bursts and yield between them.
+        for ch_num, display in self.displays.items():
+            if self._render_channel(meter, ch_num, display):
+                await display.display.show_async()
 
     def show_error(self, message):
         """Show error on all displays."""
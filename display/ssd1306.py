@@ -3,6 +3,7 @@
 
 from micropython import const
 import framebuf
+import uasyncio as asyncio
 
 # Commands
 _SET_CONTRAST = const(0x81)
@@ -27,20 +28,50 @@ _SET_CHARGE_PUMP = const(0x8D)
 class SSD1306:
     """SSD1306 OLED display driver base class."""
 
-    def __init__(self, width, height, external_vcc=False):
+    def __init__(self, width, height, external_vcc=False, shared_buffer=None):
         self.width = width
         self.height = height
         self.external_vcc = external_vcc
         self.pages = height // 8
-        self.buffer = bytearray(self.pages * width)
+        # A caller may pass one buffer to several same-size displays and
+        # render/flush them in turn; each then skips its own allocation.
+        if shared_buffer is not None:
+            self.buffer = shared_buffer
+        else:
+            self.buffer = bytearray(self.pages * width)
         self.framebuf = framebuf.FrameBuffer(
             self.buffer, width, height, framebuf.MONO_VLSB
         )
+        # Fixed window bounds, precomputed for show()
+        self._col_end = width - 1
+        self._page_end = self.pages - 1
+        # Dirty page range for partial updates; starts as full-range so
+        # the first show() transmits everything.
+        self._dirty_min_page = 0
+        self._dirty_max_page = self.pages - 1
         self.init_display()
 
+    def _mark_dirty(self, y0, y1):
+        """Expand dirty page range to cover rows y0..y1 inclusive."""
+        if y0 < 0:
+            y0 = 0
+        if y1 >= self.height:
+            y1 = self.height - 1
+        page0 = y0 >> 3
+        page1 = y1 >> 3
+        if page0 < self._dirty_min_page:
+            self._dirty_min_page = page0
+        if page1 > self._dirty_max_page:
+            self._dirty_max_page = page1
+
+    def _mark_all_dirty(self):
+        """Mark the whole display dirty."""
+        self._dirty_min_page = 0
+        self._dirty_max_page = self.pages - 1
+
     def init_display(self):
         """Initialize display with standard configuration."""
-        for cmd in (
+        self.write_cmd_many(bytes((
             _SET_DISP | 0x00,  # Display off
             _SET_MEM_ADDR, 0x00,  # Horizontal addressing mode
             _SET_DISP_START_LINE | 0x00,
@@ -57,11 +88,15 @@ class SSD1306:
             _SET_NORM_INV,  # Not inverted
             _SET_CHARGE_PUMP, 0x10 if self.external_vcc else 0x14,
             _SET_DISP | 0x01,  # Display on
-        ):
-            self.write_cmd(cmd)
+        )))
         self.fill(0)
         self.show()
 
+    def write_cmd_many(self, cmds):
+        """Write a sequence of command bytes (default: one at a time)."""
+        for cmd in cmds:
+            self.write_cmd(cmd)
+
     def poweroff(self):
         """Turn off display."""
         self.write_cmd(_SET_DISP | 0x00)
@@ -82,71 +117,153 @@ class SSD1306:
     def fill(self, col):
         """Fill entire display with color (0 or 1)."""
         self.framebuf.fill(col)
+        self._mark_all_dirty()
 
     def pixel(self, x, y, col):
         """Set pixel at x, y to color."""
         self.framebuf.pixel(x, y, col)
+        self._mark_dirty(y, y)
 
     def scroll(self, dx, dy):
         """Scroll display by dx, dy pixels."""
         self.framebuf.scroll(dx, dy)
+        self._mark_all_dirty()
 
     def text(self, string, x, y, col=1):
         """Draw text at x, y."""
         self.framebuf.text(string, x, y, col)
+        self._mark_dirty(y, y + 7)
 
     def hline(self, x, y, w, col):
         """Draw horizontal line."""
         self.framebuf.hline(x, y, w, col)
+        self._mark_dirty(y, y)
 
     def vline(self, x, y, h, col):
         """Draw vertical line."""
         self.framebuf.vline(x, y, h, col)
+        self._mark_dirty(y, y + h - 1)
 
     def line(self, x1, y1, x2, y2, col):
         """Draw line from (x1,y1) to (x2,y2)."""
         self.framebuf.line(x1, y1, x2, y2, col)
+        self._mark_dirty(min(y1, y2), max(y1, y2))
 
     def rect(self, x, y, w, h, col):
         """Draw rectangle outline."""
         self.framebuf.rect(x, y, w, h, col)
+        self._mark_dirty(y, y + h - 1)
 
     def fill_rect(self, x, y, w, h, col):
         """Draw filled rectangle."""
         self.framebuf.fill_rect(x, y, w, h, col)
+        self._mark_dirty(y, y + h - 1)
 
-    def blit(self, fbuf, x, y):
-        """Blit framebuffer at x, y."""
+    def blit(self, fbuf, x, y, h=None):
+        """Blit framebuffer at x, y (pass h to limit the dirty range)."""
         self.framebuf.blit(fbuf, x, y)
+        if h is None:
+            self._mark_all_dirty()
+        else:
+            self._mark_dirty(y, y + h - 1)
 
     def show(self):
-        """Update display with buffer contents."""
+        """Update display with buffer contents (dirty pages only)."""
+        dmin = self._dirty_min_page
+        dmax = self._dirty_max_page
+        if dmin > dmax:
+            return
         self.write_cmd(_SET_COL_ADDR)
         self.write_cmd(0)
-        self.write_cmd(self.width - 1)
+        self.write_cmd(self._col_end)
         self.write_cmd(_SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_data(self.buffer)
+        self.write_cmd(dmin)
+        self.write_cmd(dmax)
+        self.write_data(
+            memoryview(self.buffer)[dmin * self.width:(dmax + 1) * self.width]
+        )
+        self._dirty_min_page = self.pages
+        self._dirty_max_page = -1
 
 
 class SSD1306_I2C(SSD1306):
     """SSD1306 OLED display driver for I2C interface."""
 
-    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False):
+    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False,
+                 shared_buffer=None):
         self.i2c = i2c
         self.addr = addr
-        self.temp = bytearray(2)
         self.write_list = [b'\x40', None]  # Co=0, D/C#=1
-        super().__init__(width, height, external_vcc)
+        # Precomputed column/page window commands for show(), sent as one
+        # I2C transaction (Co=1, D/C#=0 control byte before each command).
+        self._cmd_seq = bytearray((
+            0x80, _SET_COL_ADDR, 0x80, 0x00, 0x80, width - 1,
+            0x80, _SET_PAGE_ADDR, 0x80, 0x00, 0x80, height // 8 - 1,
+        ))
+        super().__init__(width, height, external_vcc, shared_buffer)
+        self.write_list[1] = self.buffer
 
     def write_cmd(self, cmd):
-        """Write command byte."""
-        self.temp[0] = 0x80  # Co=1, D/C#=0
-        self.temp[1] = cmd
-        self.i2c.writeto(self.addr, self.temp)
+        """Write a single command byte (cold path; show() uses _cmd_seq)."""
+        self.i2c.writeto(self.addr, bytes((0x80, cmd)))  # Co=1, D/C#=0
+
+    def write_cmd_many(self, cmds):
+        """Write a command sequence as one Co=1 control-byte stream."""
+        # Interleave by index; MicroPython bytearrays only support
+        # step-1 slice assignment
+        buf = bytearray(2 * len(cmds))
+        i = 0
+        for cmd in cmds:
+            buf[i] = 0x80
+            buf[i + 1] = cmd
+            i += 2
+        self.i2c.writeto(self.addr, buf)
 
     def write_data(self, buf):
         """Write data buffer."""
         self.write_list[1] = buf
         self.i2c.writevto(self.addr, self.write_list)
+
+    def show(self):
+        """Update display with buffer contents (dirty pages only)."""
+        dmin = self._dirty_min_page
+        dmax = self._dirty_max_page
+        if dmin > dmax:
+            return
+        # Patch the page window into the precomputed command stream
+        seq = self._cmd_seq
+        seq[9] = dmin
+        seq[11] = dmax
+        self.i2c.writeto(self.addr, seq)
+        if dmin == 0 and dmax == self._page_end:
+            self.write_data(self.buffer)
+        else:
+            self.write_data(
+                memoryview(self.buffer)[dmin * self.width:(dmax + 1) * self.width]
+            )
+        self._dirty_min_page = self.pages
+        self._dirty_max_page = -1
+
+    async def show_async(self):
+        """Update display, yielding to the scheduler between pages.
+
+        The SSD1306 RAM pointer persists across I2C transactions, so the
+        dirty window is programmed once and the data streamed one page
+        per burst, letting other tasks (sensor reads) interleave instead
+        of blocking for the whole transfer.
+        """
+        dmin = self._dirty_min_page
+        dmax = self._dirty_max_page
+        if dmin > dmax:
+            return
+        seq = self._cmd_seq
+        seq[9] = dmin
+        seq[11] = dmax
+        self.i2c.writeto(self.addr, seq)
+        mv = memoryview(self.buffer)
+        width = self.width
+        for page in range(dmin, dmax + 1):
+            self.write_data(mv[page * width:(page + 1) * width])
+            await asyncio.sleep_ms(0)
+        self._dirty_min_page = self.pages
+        self._dirty_max_page = -1
@@ -96,35 +96,53 @@ class RFPowerMeter:
         self.scpi_handler = create_scpi_handler(self.meter, self.network)
         print("SCPI handler initialized")
 
-    async def sensor_task(self):
-        """Task for continuous sensor reading."""
-        print("Sensor task started")
+    async def meter_task(self):
+        """Combined sensor read and display refresh task.
+
+        One ticks_ms-driven loop replaces the separate sensor and
+        display tasks: the display is flushed right after a sensor read
+        completes, every Nth tick, so the two never collide on the
+        shared I2C bus and the refresh rate stays locked to the sensor
+        period instead of drifting.
+        """
+        print("Meter task started")
+
+        display_every = max(1, config.DISPLAY_UPDATE_MS // config.SENSOR_READ_MS)
+        # Calibration flush check about once a second; flush() itself
+        # decides whether any EEPROM write is due
+        flush_every = max(1, 1000 // config.SENSOR_READ_MS)
+        tick = 0
 
         while self.running:
             try:
+                t = time.ticks_ms()
+
                 # Check for hot-swap events (sensor connect/disconnect)
                 self.meter.check_presence_changes()
 
-                for channel in self.meter.channels.values():
-                    channel.read_power()
-
-                await asyncio.sleep_ms(config.SENSOR_READ_MS)
+                # Both ADC conversions overlap; the wait yields to the
+                # SCPI and mDNS tasks instead of blocking
+                await self.meter.read_all_async()
+                self.meter.publish_latest()
 
-            except Exception as e:
-                print("Sensor task error:", e)
-                await asyncio.sleep_ms(1000)
+                if tick % display_every == 0:
+                    await self.display_mgr.update_all_async(self.meter)
 
-    async def display_task(self):
-        """Task for display updates."""
-        print("Display task started")
+                if tick % flush_every == 0:
+                    self.meter.cal_mgr.flush()
+                    # Report calibration errors off the save path
+                    for event, ch, msg in self.meter.cal_mgr.pop_errors():
+                        print("Calibration {} ch{}: {}".format(event, ch, msg))
 
-        while self.running:
-            try:
-                self.display_mgr.update_all(self.meter)
-                await asyncio.sleep_ms(config.DISPLAY_UPDATE_MS)
+                tick += 1
+                elapsed = time.ticks_diff(time.ticks_ms(), t)
+                if elapsed < config.SENSOR_READ_MS:
+                    await asyncio.sleep_ms(config.SENSOR_READ_MS - elapsed)
+                else:
+                    await asyncio.sleep_ms(0)
 
             except Exception as e:
-                print("Display task error:", e)
+                print("Meter task error:", e)
                 await asyncio.sleep_ms(1000)
 
     async def scpi_server_task(self):
@@ -173,8 +191,7 @@ class RFPowerMeter:
         self.running = True
 
         tasks = [
-            asyncio.create_task(self.sensor_task()),
-            asyncio.create_task(self.display_task()),
+            asyncio.create_task(self.meter_task()),
         ]
 
         # Add network tasks if connected
@@ -203,6 +220,9 @@ class RFPowerMeter:
         except KeyboardInterrupt:
             print("\nShutting down...")
             self.running = False
+            # Push out any calibration still waiting on the quiesce timer
+            if self.meter:
+                self.meter.cal_mgr.flush(force=True)
 
 
 # Entry point
@@ -10,6 +10,15 @@ import config
 MDNS_ADDR = '224.0.0.251'
 MDNS_PORT = 5353
 
+# Max packets handled per wakeup before yielding to other tasks
+_MAX_BATCH = 16
+
+# Config values bound once; module attribute access is a dict lookup
+_MODEL = config.MODEL
+_VERSION = config.VERSION
+_SCPI_PORT = config.SCPI_PORT
+_HOSTNAME = config.MDNS_HOSTNAME
+
 # DNS record types
 TYPE_A = 1
 TYPE_PTR = 12
@@ -21,36 +30,87 @@ TYPE_ANY = 255
 CLASS_IN = 1
 CLASS_FLUSH = 0x8001
 
+# Precompiled wire formats: header, resource record, question tail,
+# SRV data and the multicast join request. ustruct has no Struct class,
+# so a thin shim keeps the bound-method call shape there.
+try:
+    _Struct = struct.Struct
+except AttributeError:
+    class _Struct:
+        def __init__(self, fmt):
+            self.fmt = fmt
+
+        def pack(self, *args):
+            return struct.pack(self.fmt, *args)
+
+        def unpack_from(self, data, offset=0):
+            return struct.unpack_from(self.fmt, data, offset)
+
+_HDR = _Struct('>HHHHHH')
+_RR = _Struct('>HHIH')
+_QQ = _Struct('>HH')
+_SRV = _Struct('>HHH')
+_MREQ = _Struct('4s4s')
+
+# uasyncio's io queue lets a task block until a bare socket is readable
+# without wrapping it in a stream; fall back to sleep-polling on ports
+# that do not expose it.
+try:
+    _io_queue = asyncio.core._io_queue
+except AttributeError:
+    _io_queue = None
+
+
+async def _sock_readable(sock):
+    """Suspend the calling task until sock has data (uasyncio only)."""
+    yield _io_queue.queue_read(sock)
+
 
 def encode_name(name):
     """Encode DNS name to wire format."""
-    result = b''
+    # Append into one bytearray; += on bytes reallocates per label
+    buf = bytearray()
     for part in name.split('.'):
         if part:
-            result += bytes([len(part)]) + part.encode('utf-8')
-    result += b'\x00'
-    return result
+            encoded = part.encode('utf-8')
+            buf.append(len(encoded))
+            buf += encoded
+    buf.append(0)
+    return bytes(buf)
 
 
 def decode_name(data, offset):
-    """Decode DNS name from wire format."""
+    """Decode DNS name from wire format.
+
+    Iterative, including compression pointers: recursion costs a Python
+    frame per pointer hop, and a crafted pointer loop could otherwise
+    blow the stack. Visited pointer targets are tracked so cycles raise
+    instead of spinning.
+    """
     parts = []
+    return_offset = -1
+    seen = None
     while True:
         length = data[offset]
         if length == 0:
             offset += 1
             break
         elif length & 0xC0 == 0xC0:
-            # Pointer
-            pointer = struct.unpack_from('>H', data, offset)[0] & 0x3FFF
-            parts.append(decode_name(data, pointer)[0])
-            offset += 2
-            break
+            # Compression pointer: follow it in place
+            pointer = ((length & 0x3F) << 8) | data[offset + 1]
+            if seen is None:
+                seen = set()
+            if pointer in seen:
+                raise ValueError("compression pointer loop")
+            seen.add(pointer)
+            if return_offset < 0:
+                return_offset = offset + 2
+            offset = pointer
         else:
             offset += 1
-            parts.append(data[offset:offset + length].decode('utf-8'))
+            parts.append(bytes(data[offset:offset + length]).decode('utf-8'))
             offset += length
-    return '.'.join(parts), offset
+    return '.'.join(parts), return_offset if return_offset >= 0 else offset
 
 
 class MDNSResponder:
@@ -64,29 +124,100 @@ class MDNSResponder:
             hostname: Local hostname (without .local)
             ip_address: IP address string
         """
-        self.hostname = hostname or config.MDNS_HOSTNAME
+        self.hostname = hostname or _HOSTNAME
         self.ip_address = ip_address
         self.socket = None
         self.running = False
 
         # Service info
         self.service_name = "_scpi-raw._tcp.local"
-        self.service_port = config.SCPI_PORT
+        self.service_port = _SCPI_PORT
+
+        # TXT payload is invariant: length-prefixed key=value pairs
+        parts = []
+        for item in ("model=" + _MODEL, "version=" + _VERSION):
+            encoded = item.encode('utf-8')
+            parts.append(bytes([len(encoded)]))
+            parts.append(encoded)
+        self._txt_data_bytes = b''.join(parts)
+
+        # Ready-to-send packets keyed by (lowercase name, qtype); names
+        # and IP only change via set_ip, so responses are built once.
+        self._cache = {}
+        self._announce_packet = None
+        self._rebuild_cache()
 
     def set_ip(self, ip_address):
         """Set IP address."""
         self.ip_address = ip_address
+        self._rebuild_cache()
+
+    def _rebuild_cache(self):
+        """Precompute all answerable response packets and the announcement."""
+        hostname_local = self.hostname + ".local"
+        service_instance = self.hostname + "." + self.service_name
+
+        # Wire-format names encoded once; the record builders reuse them
+        self._name_host_enc = encode_name(hostname_local)
+        self._name_svc_enc = encode_name(self.service_name)
+        self._name_inst_enc = encode_name(service_instance)
+
+        a_rec = self._build_a_record()
+        ptr_rec = self._build_ptr_record()
+        srv_rec = self._build_srv_record()
+        txt_rec = self._build_txt_record()
+
+        def pkt(*answers):
+            answers = [a for a in answers if a]
+            if not answers:
+                return None
+            return (_HDR.pack(0, 0x8400, 0, len(answers), 0, 0) +
+                    b''.join(answers))
+
+        # Lowercased forms computed once; queries are matched against
+        # these, never against freshly lowered copies of our names.
+        self._hostname_local_lc = hostname_local.lower()
+        self._service_name_lc = self.service_name.lower()
+        self._service_instance_lc = service_instance.lower()
+
+        cache = {}
+        host_key = self._hostname_local_lc
+        svc_key = self._service_name_lc
+        inst_key = self._service_instance_lc
+
+        a_pkt = pkt(a_rec)
+        if a_pkt:
+            cache[(host_key, TYPE_A)] = a_pkt
+            cache[(host_key, TYPE_ANY)] = a_pkt
+        ptr_pkt = pkt(ptr_rec)
+        cache[(svc_key, TYPE_PTR)] = ptr_pkt
+        cache[(svc_key, TYPE_ANY)] = ptr_pkt
+        cache[(inst_key, TYPE_SRV)] = pkt(srv_rec)
+        cache[(inst_key, TYPE_TXT)] = pkt(txt_rec)
+        cache[(inst_key, TYPE_ANY)] = pkt(srv_rec, txt_rec)
+        self._cache = cache
+
+        # Unsolicited announcement carries every record in one packet
+        self._announce_packet = pkt(a_rec, ptr_rec, srv_rec, txt_rec)
 
     def _create_socket(self):
         """Create and configure multicast socket."""
+        # One receive buffer for the life of the socket; recvfrom would
+        # otherwise allocate a fresh bytes object per packet.
+        self._rxbuf = bytearray(512)
+        self._rxmv = memoryview(self._rxbuf)
+
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        except (AttributeError, OSError):
+            pass  # Not every port/stack exposes SO_REUSEPORT
         sock.bind(('', MDNS_PORT))
 
         # Join multicast group
-        mreq = struct.pack('4s4s',
-                           socket.inet_aton(MDNS_ADDR),
-                           socket.inet_aton('0.0.0.0'))
+        mreq = _MREQ.pack(socket.inet_aton(MDNS_ADDR),
+                          socket.inet_aton('0.0.0.0'))
         sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
 
         sock.setblocking(False)
@@ -94,7 +225,7 @@ class MDNSResponder:
 
     def _build_response(self, query_name, query_type):
         """
-        Build mDNS response packet.
+        Look up the precomputed response packet for a query.
 
         Args:
             query_name: Queried name
@@ -103,91 +234,42 @@ class MDNSResponder:
         Returns:
             Response bytes or None
         """
-        hostname_local = self.hostname + ".local"
-        service_instance = self.hostname + "." + self.service_name
+        return self._cache.get((query_name.lower(), query_type))
 
-        # Check if query matches our names
-        answers = []
-
-        if query_name.lower() == hostname_local.lower():
-            if query_type in (TYPE_A, TYPE_ANY):
-                # A record response
-                answers.append(self._build_a_record(hostname_local))
-
-        elif query_name.lower() == self.service_name.lower():
-            if query_type in (TYPE_PTR, TYPE_ANY):
-                # PTR record response
-                answers.append(self._build_ptr_record())
-
-        elif query_name.lower() == service_instance.lower():
-            if query_type in (TYPE_SRV, TYPE_ANY):
-                answers.append(self._build_srv_record())
-            if query_type in (TYPE_TXT, TYPE_ANY):
-                answers.append(self._build_txt_record())
-
-        if not answers:
-            return None
-
-        # Build response header
-        # Flags: QR=1 (response), AA=1 (authoritative)
-        header = struct.pack('>HHHHHH',
-                             0,      # Transaction ID
-                             0x8400,  # Flags
-                             0,      # Questions
-                             len(answers),  # Answers
-                             0,      # Authority
-                             0)      # Additional
-
-        return header + b''.join(answers)
-
-    def _build_a_record(self, name):
+    def _build_a_record(self):
         """Build A record."""
         if not self.ip_address:
             return b''
 
         ip_bytes = socket.inet_aton(self.ip_address)
-        name_enc = encode_name(name)
 
-        return (name_enc +
-                struct.pack('>HHIH', TYPE_A, CLASS_FLUSH, 120, 4) +
+        return (self._name_host_enc +
+                _RR.pack(TYPE_A, CLASS_FLUSH, 120, 4) +
                 ip_bytes)
 
     def _build_ptr_record(self):
         """Build PTR record for service discovery."""
-        service_instance = self.hostname + "." + self.service_name
-        name_enc = encode_name(self.service_name)
-        data = encode_name(service_instance)
+        data = self._name_inst_enc
 
-        return (name_enc +
-                struct.pack('>HHIH', TYPE_PTR, CLASS_IN, 4500, len(data)) +
+        return (self._name_svc_enc +
+                _RR.pack(TYPE_PTR, CLASS_IN, 4500, len(data)) +
                 data)
 
     def _build_srv_record(self):
         """Build SRV record."""
-        service_instance = self.hostname + "." + self.service_name
-        hostname_local = self.hostname + ".local"
-        name_enc = encode_name(service_instance)
-        target = encode_name(hostname_local)
-
         # Priority, Weight, Port + target
-        data = struct.pack('>HHH', 0, 0, self.service_port) + target
+        data = _SRV.pack(0, 0, self.service_port) + self._name_host_enc
 
-        return (name_enc +
-                struct.pack('>HHIH', TYPE_SRV, CLASS_FLUSH, 120, len(data)) +
+        return (self._name_inst_enc +
+                _RR.pack(TYPE_SRV, CLASS_FLUSH, 120, len(data)) +
                 data)
 
     def _build_txt_record(self):
         """Build TXT record."""
-        service_instance = self.hostname + "." + self.service_name
-        name_enc = encode_name(service_instance)
+        txt_data = self._txt_data_bytes
 
-        # TXT data: key=value pairs
-        txt_data = b''
-        for item in ["model=" + config.MODEL, "version=" + config.VERSION]:
-            txt_data += bytes([len(item)]) + item.encode('utf-8')
-
-        return (name_enc +
-                struct.pack('>HHIH', TYPE_TXT, CLASS_FLUSH, 4500, len(txt_data)) +
+        return (self._name_inst_enc +
+                _RR.pack(TYPE_TXT, CLASS_FLUSH, 4500, len(txt_data)) +
                 txt_data)
 
     def _parse_query(self, data):
@@ -200,25 +282,23 @@ class MDNSResponder:
         Returns:
             List of (name, type) tuples
         """
-        if len(data) < 12:
+        # Fast reject before any unpacking: responses (QR=1) from other
+        # responders make up about half of mDNS multicast traffic, and
+        # question-free packets are equally uninteresting.
+        if len(data) < 12 or (data[2] & 0x80):
             return []
-
-        # Parse header
-        header = struct.unpack_from('>HHHHHH', data, 0)
-        flags = header[1]
-        questions = header[2]
-
-        # Only process queries (QR=0)
-        if flags & 0x8000:
+        if data[4] == 0 and data[5] == 0:
             return []
 
+        questions = _HDR.unpack_from(data, 0)[2]
+
         queries = []
         offset = 12
 
         for _ in range(questions):
             try:
                 name, offset = decode_name(data, offset)
-                qtype, qclass = struct.unpack_from('>HH', data, offset)
+                qtype, qclass = _QQ.unpack_from(data, offset)
                 offset += 4
                 queries.append((name, qtype))
             except Exception:
@@ -233,55 +313,57 @@ class MDNSResponder:
 
         print("mDNS responder started for {}.local".format(self.hostname))
 
+        # Not all ports provide recvfrom_into; fall back to recvfrom
+        use_into = hasattr(self.socket, 'recvfrom_into')
+
         while self.running:
             try:
-                # Non-blocking receive
-                try:
-                    data, addr = self.socket.recvfrom(512)
-                except OSError:
+                if _io_queue is not None:
+                    # Block in the scheduler until a packet arrives
+                    await _sock_readable(self.socket)
+
+                # Drain all packets queued during this wakeup in a tight
+                # loop (startup announcement storms arrive in bursts),
+                # capped so one noisy burst cannot starve other tasks.
+                handled = 0
+                while handled < _MAX_BATCH:
+                    try:
+                        if use_into:
+                            n, addr = self.socket.recvfrom_into(self._rxbuf)
+                            data = self._rxmv[:n]
+                        else:
+                            data, addr = self.socket.recvfrom(512)
+                    except OSError:
+                        break
+                    handled += 1
+
+                    # Multicast loops our own responses back; drop them
+                    # on source address before any parsing
+                    if addr[0] == self.ip_address:
+                        continue
+
+                    for name, qtype in self._parse_query(data):
+                        response = self._build_response(name, qtype)
+                        if response:
+                            self.socket.sendto(
+                                response, (MDNS_ADDR, MDNS_PORT))
+
+                if handled == 0 and _io_queue is None:
                     await asyncio.sleep_ms(100)
-                    continue
-
-                # Parse queries
-                queries = self._parse_query(data)
-
-                for name, qtype in queries:
-                    response = self._build_response(name, qtype)
-                    if response:
-                        self.socket.sendto(response, (MDNS_ADDR, MDNS_PORT))
 
             except Exception as e:
                 print("mDNS error:", e)
                 await asyncio.sleep_ms(1000)
 
-            await asyncio.sleep_ms(10)
+            if _io_queue is None:
+                await asyncio.sleep_ms(10)
 
     def announce(self):
-        """Send unsolicited announcement."""
+        """Send unsolicited announcement (precomputed packet)."""
         if not self.socket or not self.ip_address:
             return
-
-        hostname_local = self.hostname + ".local"
-
-        # Build announcement with A, SRV, TXT, PTR records
-        answers = [
-            self._build_a_record(hostname_local),
-            self._build_ptr_record(),
-            self._build_srv_record(),
-            self._build_txt_record(),
-        ]
-        answers = [a for a in answers if a]
-
-        if answers:
-            header = struct.pack('>HHHHHH',
-                                 0,
-                                 0x8400,
-                                 0,
-                                 len(answers),
-                                 0,
-                                 0)
-            packet = header + b''.join(answers)
-            self.socket.sendto(packet, (MDNS_ADDR, MDNS_PORT))
+        if self._announce_packet:
+            self.socket.sendto(self._announce_packet, (MDNS_ADDR, MDNS_PORT))
 
     def stop(self):
         """Stop responder."""
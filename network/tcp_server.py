@@ -2,8 +2,13 @@
 # Async TCP server handling SCPI protocol
 
 import uasyncio as asyncio
+import usocket as socket
 import config
 
+# SCPI line framing limits
+_READ_CHUNK = 128    # Stream read size while scanning for newline
+_MAX_LINE = 512      # Lines longer than this are dropped, not buffered
+
 
 class SCPIConnection:
     """Handles a single SCPI client connection."""
@@ -26,44 +31,65 @@ class SCPIConnection:
 
     async def handle(self):
         """Handle connection - read commands and send responses."""
+        # Carry-over kept as bytes: MicroPython's bytearray has no
+        # find() and no slice deletion, so consume lines by reslicing
+        rxbuf = b''
         try:
             while self.active:
-                # Read line (command terminated by \n)
-                try:
-                    line = await asyncio.wait_for(
-                        self.reader.readline(),
-                        timeout=300  # 5 minute timeout
-                    )
-                except asyncio.TimeoutError:
-                    break
-
-                if not line:
-                    break
-
-                # Decode and strip
-                try:
-                    command = line.decode('utf-8').strip()
-                except UnicodeError:
-                    command = line.decode('latin-1').strip()
+                # Frame lines ourselves in one persistent buffer;
+                # readline() allocates a fresh bytes object per line on
+                # top of the stream's own buffering.
+                idx = rxbuf.find(b'\n')
+                if idx < 0:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            self.reader.read(_READ_CHUNK),
+                            timeout=300  # 5 minute timeout
+                        )
+                    except asyncio.TimeoutError:
+                        break
+
+                    if not chunk:
+                        break
+
+                    rxbuf += chunk
+                    if len(rxbuf) > _MAX_LINE and rxbuf.find(b'\n') < 0:
+                        # Unterminated oversized line; drop it rather
+                        # than letting a hostile peer grow the buffer
+                        rxbuf = b''
+                    continue
+
+                line = rxbuf[:idx]
+                rxbuf = rxbuf[idx + 1:]
+
+                # SCPI is plain ASCII; decode once, mapping any stray
+                # high bytes to U+FFFD instead of retrying in latin-1
+                command = line.decode('ascii', 'replace').strip()
 
                 if not command:
                     continue
 
-                # Handle multiple commands separated by semicolon
-                commands = command.split(';')
+                # Handle multiple commands separated by semicolon,
+                # dispatching each token as it is stripped
                 responses = []
-
-                for cmd in commands:
+                for cmd in command.split(';'):
                     cmd = cmd.strip()
-                    if cmd:
-                        response = await self._process_command(cmd)
-                        if response is not None:
-                            responses.append(response)
-
-                # Send responses
+                    if not cmd:
+                        continue
+                    response = self._process_command(cmd)
+                    if response is not None:
+                        responses.append(response)
+
+                # Send responses: build the wire bytes directly instead
+                # of materializing a joined str and encoding it
                 if responses:
-                    response_text = ';'.join(responses) + '\n'
-                    self.writer.write(response_text.encode('utf-8'))
+                    buf = bytearray()
+                    for response in responses:
+                        if buf:
+                            buf += b';'
+                        buf += response.encode('utf-8')
+                    buf.append(0x0A)
+                    self.writer.write(buf)
                     await self.writer.drain()
 
         except Exception as e:
@@ -71,7 +97,7 @@ class SCPIConnection:
         finally:
             await self.close()
 
-    async def _process_command(self, command):
+    def _process_command(self, command):
         """
         Process a single SCPI command.
 
@@ -112,8 +138,9 @@ class TCPServer:
         self.port = port or config.SCPI_PORT
         self.max_connections = max_connections
         self.server = None
-        self.connections = {}
-        self._conn_counter = 0
+        # Fixed slot list: index serves as the connection id, and
+        # accept/close touch a list cell instead of a dict entry
+        self.connections = [None] * max_connections
         self.running = False
 
     async def start(self):
@@ -129,37 +156,53 @@ class TCPServer:
 
     async def _handle_client(self, reader, writer):
         """Handle new client connection."""
-        # Check connection limit
-        if len(self.connections) >= self.max_connections:
+        # Find a free slot; all full means too many connections
+        try:
+            slot = self.connections.index(None)
+        except ValueError:
             writer.write(b"ERROR: Too many connections\n")
             await writer.drain()
             writer.close()
             await writer.wait_closed()
             return
 
-        # Create connection handler
-        self._conn_counter += 1
-        conn_id = self._conn_counter
-        conn = SCPIConnection(reader, writer, self.scpi_handler, conn_id)
-        self.connections[conn_id] = conn
+        # Disable Nagle so short query replies go out immediately, and
+        # enable keepalive so dead peers release their slot eventually.
+        # MicroPython's Stream.get_extra_info raises KeyError for keys
+        # it doesn't track ('socket' among them) instead of returning
+        # None, so the probe itself is best-effort.
+        try:
+            sock = writer.get_extra_info('socket')
+        except Exception:
+            sock = None
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            except (AttributeError, OSError):
+                pass  # Constants or option support vary per port
+
+        # Create connection handler (slot index doubles as id)
+        conn = SCPIConnection(reader, writer, self.scpi_handler, slot)
+        self.connections[slot] = conn
 
         try:
             addr = writer.get_extra_info('peername')
-            print("Connection {} from {}".format(conn_id, addr))
+            print("Connection {} from {}".format(slot, addr))
             await conn.handle()
         finally:
-            if conn_id in self.connections:
-                del self.connections[conn_id]
-            print("Connection {} closed".format(conn_id))
+            self.connections[slot] = None
+            print("Connection {} closed".format(slot))
 
     async def stop(self):
         """Stop the server."""
         self.running = False
 
         # Close all connections
-        for conn in list(self.connections.values()):
-            await conn.close()
-        self.connections.clear()
+        for i, conn in enumerate(self.connections):
+            if conn is not None:
+                await conn.close()
+                self.connections[i] = None
 
         # Close server
         if self.server:
@@ -169,7 +212,7 @@ class TCPServer:
 
     def get_connection_count(self):
         """Get number of active connections."""
-        return len(self.connections)
+        return sum(1 for conn in self.connections if conn is not None)
 
 
 async def run_server(scpi_handler, port=None):
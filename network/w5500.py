@@ -17,17 +17,11 @@ class W5500Network:
         self.ip_address = None
         self.mac_address = None
 
-    def init(self):
-        """
-        Initialize SPI and W5500.
-
-        Returns:
-            True if successful
-        """
-        # Initialize SPI
+    def _reset_begin(self):
+        """Set up SPI and pull the W5500 reset line low."""
         self.spi = SPI(
             config.W5500_SPI_ID,
-            baudrate=10_000_000,
+            baudrate=config.W5500_SPI_BAUD,
             polarity=0,
             phase=0,
             sck=Pin(config.W5500_SCK),
@@ -35,14 +29,12 @@ class W5500Network:
             miso=Pin(config.W5500_MISO),
         )
 
-        # Reset W5500
         rst = Pin(config.W5500_RST, Pin.OUT)
         rst.value(0)
-        time.sleep_ms(100)
-        rst.value(1)
-        time.sleep_ms(100)
+        return rst
 
-        # Initialize network interface
+    def _attach(self, rst):
+        """Attach the driver after the reset pulse has settled."""
         cs = Pin(config.W5500_CS, Pin.OUT)
         self.nic = network.WIZNET5K(self.spi, cs, rst)
 
@@ -51,6 +43,37 @@ class W5500Network:
 
         return True
 
+    def init(self):
+        """
+        Initialize SPI and W5500 (blocking).
+
+        Returns:
+            True if successful
+        """
+        rst = self._reset_begin()
+        time.sleep_ms(100)
+        rst.value(1)
+        time.sleep_ms(100)
+        return self._attach(rst)
+
+    async def init_async(self):
+        """
+        Initialize SPI and W5500 without blocking the scheduler.
+
+        The two 100 ms reset delays yield to other tasks instead of
+        stalling the event loop.
+
+        Returns:
+            True if successful
+        """
+        import uasyncio as asyncio
+
+        rst = self._reset_begin()
+        await asyncio.sleep_ms(100)
+        rst.value(1)
+        await asyncio.sleep_ms(100)
+        return self._attach(rst)
+
     def connect(self, use_dhcp=True, static_ip=None, timeout_ms=10000):
         """
         Connect to network.
@@ -122,7 +145,11 @@ class W5500Network:
 
     def _format_mac(self, mac_bytes):
         """Format MAC address bytes as string."""
-        return ':'.join('{:02X}'.format(b) for b in mac_bytes)
+        try:
+            # Single C-level call; separator arg needs a recent build
+            return bytes(mac_bytes).hex(':').upper()
+        except TypeError:
+            return ':'.join('{:02X}'.format(b) for b in mac_bytes)
 
 
 # Singleton instance
@@ -151,7 +178,7 @@ async def init_network_async(use_dhcp=True, timeout_ms=10000):
     import uasyncio as asyncio
 
     net = get_network()
-    net.init()
+    await net.init_async()
 
     if use_dhcp:
         net.nic.active(True)
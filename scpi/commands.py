@@ -5,6 +5,26 @@ from .parser import SCPIParser
 from sensors.power_sensor import UNIT_DBM, UNIT_DBW, UNIT_MW, UNIT_W
 import config
 
+# SCPI "not a number" response, shared by all measurement queries
+_NAN = "9.91E37"
+
+_SCALES = (1, 10, 100, 1000, 10000, 100000, 1000000)
+
+
+def _fmt(value, places):
+    """Format value with a fixed number of decimals using integer math.
+
+    Float formatting through str.format is slow without an FPU; scaling
+    to an integer and printing the two halves avoids it. The fractional
+    part is zero-padded by taking the digits of scale + frac.
+    """
+    scale = _SCALES[places]
+    n = int(value * scale + (0.5 if value >= 0 else -0.5))
+    sign = "-" if n < 0 else ""
+    if n < 0:
+        n = -n
+    return "{}{}.{}".format(sign, n // scale, str(scale + n % scale)[1:])
+
 
 class SCPICommandHandler:
     """Handles SCPI commands for the RF power meter."""
@@ -21,6 +41,12 @@ class SCPICommandHandler:
         self.network = network
         self.parser = SCPIParser()
         self.opc_flag = True  # Operation complete
+        # Channel 1 resolved once; measurement queries hit it on every
+        # poll and skip the get_channel call
+        self._default_channel = power_meter.get_channel(1)
+        # Catalog strings keyed by (channel, sensor type); the catalog
+        # only changes when the sensor does, which changes the key
+        self._catalog_cache = {}
 
         self._register_commands()
 
@@ -72,10 +98,6 @@ class SCPICommandHandler:
         """
         return self.parser.execute(command_str)
 
-    def _get_channel(self, cmd, default=1):
-        """Get channel number from command."""
-        return cmd.channel if cmd.channel else default
-
     # === IEEE 488.2 Common Commands ===
 
     def _cmd_idn(self, cmd):
@@ -115,16 +137,18 @@ class SCPICommandHandler:
 
     def _cmd_measure(self, cmd):
         """MEASure command - trigger measurement."""
-        ch = self._get_channel(cmd)
-        channel = self.meter.get_channel(ch)
+        ch = cmd.channel
+        channel = (self._default_channel if ch == 1
+                   else self.meter.get_channel(ch))
         if channel:
             channel.read_power()
         return None
 
     def _query_power(self, cmd):
         """MEASure:POWer? - Query power reading."""
-        ch = self._get_channel(cmd)
-        channel = self.meter.get_channel(ch)
+        ch = cmd.channel
+        channel = (self._default_channel if ch == 1
+                   else self.meter.get_channel(ch))
 
         if channel is None:
             self.parser.add_error(-200, "Invalid channel")
@@ -132,27 +156,28 @@ class SCPICommandHandler:
 
         if channel.sensor_type is None:
             self.parser.add_error(-230, "No sensor detected")
-            return "9.91E37"  # SCPI "not a number"
+            return _NAN
 
         power, unit = channel.get_power()
         if power is None:
-            return "9.91E37"
+            return _NAN
 
-        return "{:.3f}".format(power)
+        return _fmt(power, 3)
 
     def _query_voltage(self, cmd):
         """MEASure:VOLTage? - Query raw voltage."""
-        ch = self._get_channel(cmd)
-        channel = self.meter.get_channel(ch)
+        ch = cmd.channel
+        channel = (self._default_channel if ch == 1
+                   else self.meter.get_channel(ch))
 
         if channel is None:
             return None
 
-        return "{:.6f}".format(channel.power_voltage)
+        return _fmt(channel.power_voltage, 6)
 
     def _cmd_unit(self, cmd):
         """MEASure:POWer:UNIT - Set power unit."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         channel = self.meter.get_channel(ch)
 
         if channel is None:
@@ -175,7 +200,7 @@ class SCPICommandHandler:
 
     def _query_unit(self, cmd):
         """MEASure:POWer:UNIT? - Query power unit."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         channel = self.meter.get_channel(ch)
 
         if channel is None:
@@ -185,7 +210,7 @@ class SCPICommandHandler:
 
     def _cmd_average(self, cmd):
         """MEASure:POWer:AVERage - Set averaging count."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         channel = self.meter.get_channel(ch)
 
         if channel is None:
@@ -197,7 +222,7 @@ class SCPICommandHandler:
 
     def _query_average(self, cmd):
         """MEASure:POWer:AVERage? - Query averaging count."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         channel = self.meter.get_channel(ch)
 
         if channel is None:
@@ -209,7 +234,7 @@ class SCPICommandHandler:
 
     def _cmd_frequency(self, cmd):
         """SENSe:FREQuency - Set operating frequency in MHz."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         freq = cmd.get_param_float()
 
         if freq is None:
@@ -236,7 +261,7 @@ class SCPICommandHandler:
 
     def _query_frequency(self, cmd):
         """SENSe:FREQuency? - Query current operating frequency in MHz."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         freq = self.meter.get_frequency(ch)
 
         if freq is None:
@@ -246,14 +271,23 @@ class SCPICommandHandler:
 
     def _query_freq_catalog(self, cmd):
         """SENSe:FREQuency:CATalog? - Query available calibration frequencies."""
-        ch = self._get_channel(cmd)
-        freqs = self.meter.get_frequencies(ch)
+        ch = cmd.channel
+        channel = self.meter.get_channel(ch)
+        # The catalog lives in the sensor head's EEPROM, so two units
+        # of the same type can carry different frequency tables; the
+        # serial distinguishes them across hot-swaps
+        if channel:
+            key = (ch, channel.sensor_type, channel.sensor_serial)
+        else:
+            key = (ch, None, None)
 
-        if not freqs:
-            return ""
+        catalog = self._catalog_cache.get(key)
+        if catalog is None:
+            freqs = self.meter.get_frequencies(ch)
+            catalog = ",".join(str(f) for f in freqs) if freqs else ""
+            self._catalog_cache[key] = catalog
 
-        # Return comma-separated list
-        return ",".join(str(f) for f in freqs)
+        return catalog
 
     # === Attenuator Commands ===
 
@@ -263,7 +297,7 @@ class SCPICommandHandler:
         Example: SENS1:ATT 40 sets a 40 dB attenuator on channel 1.
         The meter will add this value to measured power when reporting.
         """
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         channel = self.meter.get_channel(ch)
 
         if channel is None:
@@ -276,41 +310,41 @@ class SCPICommandHandler:
 
     def _query_attenuator(self, cmd):
         """SENSe:ATTenuation? - Query external attenuator value in dB."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         channel = self.meter.get_channel(ch)
 
         if channel is None:
             return "0"
 
-        return "{:.1f}".format(channel.get_attenuator())
+        return _fmt(channel.get_attenuator(), 1)
 
     # === Calibration Commands ===
 
     def _cmd_cal_offset(self, cmd):
         """CALibrate:POWer:OFFSet - Set calibration offset for current frequency."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         offset = cmd.get_param_float(0.0)
         self.meter.set_cal_offset(ch, offset)  # Uses current frequency
         return None
 
     def _query_cal_offset(self, cmd):
         """CALibrate:POWer:OFFSet? - Query calibration offset for current frequency."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         offset = self.meter.cal_mgr.get_offset(ch)  # Uses current frequency
-        return "{:.3f}".format(offset)
+        return _fmt(offset, 3)
 
     def _cmd_cal_slope(self, cmd):
         """CALibrate:POWer:SLOPe - Set calibration slope for current frequency."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         slope = cmd.get_param_float(1.0)
         self.meter.set_cal_slope(ch, slope)  # Uses current frequency
         return None
 
     def _query_cal_slope(self, cmd):
         """CALibrate:POWer:SLOPe? - Query calibration slope for current frequency."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         slope = self.meter.cal_mgr.get_slope(ch)  # Uses current frequency
-        return "{:.6f}".format(slope)
+        return _fmt(slope, 6)
 
     def _cmd_cal_save(self, cmd):
         """CALibrate:POWer:SAVE - Save calibration to flash."""
@@ -322,7 +356,7 @@ class SCPICommandHandler:
 
     def _cmd_cal_restore(self, cmd):
         """CALibrate:POWer:RESTore - Restore default calibration."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         self.meter.restore_calibration(ch)
         return None
 
@@ -332,7 +366,7 @@ class SCPICommandHandler:
 
     def _query_sensor_type(self, cmd):
         """CALibrate:SENSor:TYPE? - Query detected sensor type."""
-        ch = self._get_channel(cmd)
+        ch = cmd.channel
         channel = self.meter.get_channel(ch)
 
         if channel is None:
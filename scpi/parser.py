@@ -2,6 +2,39 @@
 # Parses SCPI command strings into structured commands
 
 import re
+from collections import deque
+
+# Entries kept in the parsed-command cache (polling clients resend the
+# same few query strings continuously)
+_PARSE_CACHE_SIZE = 32
+
+
+def _compile_pattern(pattern):
+    """
+    Compile a pattern like "MEASure:POWer" into (required_length,
+    full_form) pairs, one per keyword. Uppercase letters mark the
+    required abbreviation per standard SCPI convention.
+    """
+    compiled = []
+    for part in pattern.split(':'):
+        required = sum(1 for c in part if c.isupper())
+        compiled.append((required, part.upper()))
+    return compiled
+
+
+def _match_compiled(keywords, compiled):
+    """
+    Match parsed keywords against a compiled pattern.
+
+    A keyword matches when it is at least the required length and a
+    prefix of the full form.
+    """
+    if len(keywords) != len(compiled):
+        return False
+    for kw, (req_len, full) in zip(keywords, compiled):
+        if len(kw) < req_len or not full.startswith(kw):
+            return False
+    return True
 
 
 class SCPICommand:
@@ -17,7 +50,9 @@ class SCPICommand:
         self.raw = command_str.strip()
         self.is_query = self.raw.endswith('?')
         self.keywords = []
-        self.channel = None
+        # Default channel; overwritten when the command carries a
+        # numeric suffix. Handlers read this directly.
+        self.channel = 1
         self.parameter = None
 
         self._parse()
@@ -40,8 +75,9 @@ class SCPICommand:
             # Common command (*IDN?, *RST, etc.)
             self.keywords = [cmd_part.upper()]
         else:
-            # Hierarchical command (MEAS:POW1?)
-            self.keywords = [k.upper() for k in cmd_part.split(':')]
+            # Hierarchical command (MEAS:POW1?); uppercase the whole
+            # string once rather than each keyword after splitting
+            self.keywords = cmd_part.upper().split(':')
 
         # Extract channel number from last keyword
         self._extract_channel()
@@ -53,8 +89,9 @@ class SCPICommand:
 
         last_kw = self.keywords[-1]
 
-        # Check for numeric suffix (POW1, POW2)
-        if last_kw and last_kw[-1].isdigit():
+        # Check for numeric suffix (POW1, POW2); the range comparison
+        # avoids an isdigit() method call per command
+        if last_kw and '0' <= last_kw[-1] <= '9':
             self.channel = int(last_kw[-1])
             # Store keyword without channel suffix
             self.keywords[-1] = last_kw[:-1]
@@ -64,7 +101,9 @@ class SCPICommand:
         Check if command matches pattern.
 
         Pattern format: "MEAS:POW" or "MEASure:POWer" (short:long forms)
-        Uses standard SCPI matching rules.
+        Uses standard SCPI matching rules. Registered patterns are
+        matched through their precompiled form instead; this compiles
+        on the fly for ad hoc patterns.
 
         Args:
             pattern: Command pattern to match
@@ -72,39 +111,7 @@ class SCPICommand:
         Returns:
             True if command matches pattern
         """
-        pattern_parts = pattern.upper().split(':')
-
-        if len(self.keywords) != len(pattern_parts):
-            return False
-
-        for kw, pat in zip(self.keywords, pattern_parts):
-            if not self._keyword_match(kw, pat):
-                return False
-
-        return True
-
-    def _keyword_match(self, keyword, pattern):
-        """
-        Match keyword against pattern using SCPI rules.
-
-        SCPI allows abbreviation to minimum unambiguous form.
-        Convention: uppercase letters are required, lowercase optional.
-        e.g., "MEASure" matches "MEAS", "MEASU", "MEASUR", "MEASURE"
-        """
-        # Extract required part (uppercase in pattern)
-        required = ''.join(c for c in pattern if c.isupper())
-        full = pattern.upper()
-
-        kw = keyword.upper()
-
-        # Check if keyword matches required prefix and is prefix of full
-        if len(kw) < len(required):
-            return False
-
-        if not full.startswith(kw):
-            return False
-
-        return True
+        return _match_compiled(self.keywords, _compile_pattern(pattern))
 
     def get_param_float(self, default=None):
         """Get parameter as float."""
@@ -142,7 +149,18 @@ class SCPIParser:
     def __init__(self):
         """Initialize parser with empty command registry."""
         self.commands = {}
-        self.error_queue = []
+        # Flat dispatch table: every accepted abbreviation of every
+        # registered pattern, keyed by keyword tuple, built at register
+        # time so execute() resolves commands with one dict lookup.
+        self._dispatch = {}
+        # Parsed commands keyed by the exact raw string; identical
+        # input parses identically, so hits skip the whole split/upper
+        # pipeline. FIFO-evicted at _PARSE_CACHE_SIZE entries.
+        self._parse_cache = {}
+        self._parse_order = []
+        # Bounded ring buffer: append and popleft are O(1), and a full
+        # queue drops the oldest entry without a pop(0) list shuffle
+        self.error_queue = deque((), 10)
 
     def register(self, pattern, handler, query_handler=None):
         """
@@ -154,11 +172,32 @@ class SCPIParser:
             query_handler: Function to call for query (optional)
         """
         key = pattern.upper()
-        self.commands[key] = {
+        entry = {
             'pattern': pattern,
             'handler': handler,
             'query_handler': query_handler or handler,
         }
+        self.commands[key] = entry
+
+        # Compile the pattern once: (required_length, full_form) per
+        # keyword for the fallback matcher, and all accepted forms
+        # (required prefix up to the full form) for the dispatch table.
+        # ~20 patterns of 1-3 short keywords keep the table small.
+        compiled = _compile_pattern(pattern)
+        entry['compiled'] = compiled
+        part_forms = [
+            [full[:n] for n in range(required, len(full) + 1)]
+            for required, full in compiled
+        ]
+
+        # Dispatch values are bare (handler, query_handler) pairs so
+        # execute() indexes by is_query with no dict field access
+        pair = (entry['handler'], entry['query_handler'])
+        keys = [()]
+        for forms in part_forms:
+            keys = [k + (f,) for k in keys for f in forms]
+        for k in keys:
+            self._dispatch[k] = pair
 
     def parse(self, command_str):
         """
@@ -170,7 +209,16 @@ class SCPIParser:
         Returns:
             SCPICommand instance
         """
-        return SCPICommand(command_str)
+        cmd = self._parse_cache.get(command_str)
+        if cmd is not None:
+            return cmd
+
+        cmd = SCPICommand(command_str)
+        if len(self._parse_order) >= _PARSE_CACHE_SIZE:
+            del self._parse_cache[self._parse_order.pop(0)]
+        self._parse_cache[command_str] = cmd
+        self._parse_order.append(command_str)
+        return cmd
 
     def execute(self, command_str):
         """
@@ -182,37 +230,45 @@ class SCPIParser:
         Returns:
             Response string or None
         """
-        try:
-            cmd = self.parse(command_str)
-
-            # Find matching handler
-            for key, entry in self.commands.items():
-                if cmd.match(entry['pattern']):
-                    handler = entry['query_handler'] if cmd.is_query else entry['handler']
-                    return handler(cmd)
-
-            # No match found
+        cmd = self.parse(command_str)
+
+        # Single dict probe for the common case; linear pattern
+        # scan only as a safety net
+        pair = self._dispatch.get(tuple(cmd.keywords))
+        if pair is None:
+            for candidate in self.commands.values():
+                if _match_compiled(cmd.keywords,
+                                   candidate['compiled']):
+                    pair = (candidate['handler'],
+                            candidate['query_handler'])
+                    break
+
+        if pair is None:
             self.add_error(-100, "Command error: Unknown command")
             return None
 
-        except Exception as e:
+        # Only the handler call is guarded: bad parameters, missing
+        # channels and I2C faults become queued errors, while genuine
+        # bugs propagate instead of being swallowed here
+        try:
+            return (pair[1] if cmd.is_query else pair[0])(cmd)
+        except (ValueError, KeyError, TypeError, OSError) as e:
             self.add_error(-200, "Execution error: {}".format(e))
             return None
 
     def add_error(self, code, message):
-        """Add error to queue."""
+        """Add error to queue (oldest entry dropped when full)."""
         self.error_queue.append((code, message))
-        # Limit queue size
-        if len(self.error_queue) > 10:
-            self.error_queue.pop(0)
 
     def get_error(self):
         """Get and remove oldest error."""
         if self.error_queue:
-            code, msg = self.error_queue.pop(0)
+            code, msg = self.error_queue.popleft()
             return "{},\"{}\"".format(code, msg)
         return "0,\"No error\""
 
     def clear_errors(self):
         """Clear error queue."""
-        self.error_queue.clear()
+        # MicroPython's deque has no clear(); drain it instead
+        while self.error_queue:
+            self.error_queue.popleft()
@@ -2,7 +2,6 @@
 # Supports differential and single-ended readings
 
 from micropython import const
-import struct
 import time
 
 # Register addresses
@@ -52,17 +51,8 @@ RATE_250 = const(0x00A0)        # 250 SPS
 RATE_475 = const(0x00C0)        # 475 SPS
 RATE_860 = const(0x00E0)        # 860 SPS
 
-# Conversion delays (ms) for each rate
-_RATE_DELAY = {
-    RATE_8: 130,
-    RATE_16: 65,
-    RATE_32: 35,
-    RATE_64: 20,
-    RATE_128: 10,
-    RATE_250: 5,
-    RATE_475: 3,
-    RATE_860: 2,
-}
+# Conversion delays (ms) indexed by rate bits: (rate >> 5) & 7
+_RATE_DELAY_TBL = (130, 65, 35, 20, 10, 5, 3, 2)
 
 # Mode
 _MODE_CONTINUOUS = const(0x0000)
@@ -89,7 +79,29 @@ class ADS1115:
         self.address = address
         self.gain = gain
         self.rate = rate
+        self._rate_delay = _RATE_DELAY_TBL[(rate >> 5) & 7]
+        self._scale = _PGA_RANGE.get(gain, 2.048) / 32767.0
+        # Config word minus the mux bits, rebuilt on gain/rate change;
+        # _read_raw just ORs in the mux instead of five global lookups
+        self._base_cfg = (_OS_SINGLE | gain | _MODE_SINGLE |
+                          rate | _COMP_DISABLE)
         self._buffer = bytearray(3)
+        self._reg_buf = bytearray(1)
+        self._read_buf = bytearray(2)
+        # readfrom_mem_into does pointer write + repeated start + read
+        # as one hardware transaction; not every port exposes it
+        self._use_mem = hasattr(i2c, 'readfrom_mem_into')
+        # Last register the device pointer is aimed at; the ADS1115
+        # retains it, so repeated reads of one register skip the
+        # 1-byte pointer write.
+        self._last_reg = None
+        # Conversion time is deterministic once the datasheet delay has
+        # elapsed; set True to double-check the OS flag with one extra
+        # config read per sample (only useful on a heavily shared bus).
+        self.verify_conversion = False
+        # True while the chip free-runs A0-A1 conversions; see
+        # configure_continuous
+        self.continuous = False
 
     def _write_register(self, reg, value):
         """Write 16-bit value to register."""
@@ -97,12 +109,27 @@ class ADS1115:
         self._buffer[1] = (value >> 8) & 0xFF
         self._buffer[2] = value & 0xFF
         self.i2c.writeto(self.address, self._buffer)
+        self._last_reg = reg
 
     def _read_register(self, reg):
         """Read 16-bit value from register."""
-        self.i2c.writeto(self.address, bytes([reg]))
-        data = self.i2c.readfrom(self.address, 2)
-        return struct.unpack('>h', data)[0]
+        if reg != self._last_reg:
+            self._last_reg = reg
+            if self._use_mem:
+                # Single combined transaction saves one START/STOP
+                self.i2c.readfrom_mem_into(self.address, reg,
+                                           self._read_buf)
+                buf = self._read_buf
+                v = (buf[0] << 8) | buf[1]
+                return v - 0x10000 if v & 0x8000 else v
+            self._reg_buf[0] = reg
+            self.i2c.writeto(self.address, self._reg_buf)
+        self.i2c.readfrom_into(self.address, self._read_buf)
+        # Inline big-endian signed decode; struct.unpack costs a module
+        # call and a tuple per read
+        buf = self._read_buf
+        v = (buf[0] << 8) | buf[1]
+        return v - 0x10000 if v & 0x8000 else v
 
     def _read_raw(self, mux):
         """
@@ -114,27 +141,113 @@ class ADS1115:
         Returns:
             Signed 16-bit ADC value
         """
-        config = (_OS_SINGLE | mux | self.gain |
-                  _MODE_SINGLE | self.rate | _COMP_DISABLE)
-        self._write_register(_REG_CONFIG, config)
+        self._write_register(_REG_CONFIG, self._base_cfg | mux)
 
-        # Wait for conversion
-        delay = _RATE_DELAY.get(self.rate, 10)
-        time.sleep_ms(delay)
+        # Wait out the datasheet conversion time
+        time.sleep_ms(self._rate_delay)
+
+        # Optional single completion check; each config read is two I2C
+        # transactions, so this is off by default
+        if self.verify_conversion:
+            if not self._read_register(_REG_CONFIG) & _OS_NOTBUSY:
+                time.sleep_ms(1)
 
-        # Poll for completion (backup)
-        for _ in range(10):
-            if self._read_register(_REG_CONFIG) & _OS_NOTBUSY:
-                break
-            time.sleep_ms(1)
+        raw = self._read_register(_REG_CONVERSION)
 
-        return self._read_register(_REG_CONVERSION)
+        # The single-shot config above dropped the chip out of
+        # free-running mode; put it back so read_result() consumers
+        # keep seeing fresh conversions
+        if self.continuous:
+            self.configure_continuous()
+
+        return raw
 
     def read_diff_0_1(self):
         """Read differential voltage between AIN0 and AIN1 (power sensor)."""
+        # Free-running mode already converts A0-A1 continuously; the
+        # latest sample is at most one rate period old, so skip the
+        # single-shot trigger-and-wait cycle entirely
+        if self.continuous:
+            return self.read_result()
         raw = self._read_raw(_MUX_DIFF_0_1)
         return self._raw_to_voltage(raw)
 
+    @property
+    def conversion_ms(self):
+        """Datasheet conversion time for the current rate (ms)."""
+        return self._rate_delay
+
+    def configure_continuous(self):
+        """
+        Put the converter in free-running A0-A1 mode.
+
+        One config write starts continuous conversion at the set rate;
+        readers then just fetch the conversion register with
+        read_result() — no config write or conversion wait per sample.
+        Valid data appears one conversion time after the call.
+        """
+        self._write_register(_REG_CONFIG,
+                             _MUX_DIFF_0_1 | self.gain |
+                             _MODE_CONTINUOUS | self.rate | _COMP_DISABLE)
+        self.continuous = True
+
+    def stop_continuous(self):
+        """Return to single-shot mode (chip idles between readings)."""
+        self._write_register(_REG_CONFIG, self._base_cfg | _MUX_DIFF_0_1)
+        self.continuous = False
+
+    def start_conversion(self):
+        """
+        Start a single-shot A0-A1 conversion without waiting.
+
+        Pair with read_result() after conversion_ms has elapsed;
+        lets the caller run several ADCs' conversions concurrently.
+        """
+        self._write_register(_REG_CONFIG, self._base_cfg | _MUX_DIFF_0_1)
+
+    def read_result(self):
+        """Read the completed conversion as a voltage."""
+        return self._read_register(_REG_CONVERSION) * self._scale
+
+    def read_diff_0_1_batch(self, n):
+        """
+        Read n averaged A0-A1 differential samples in continuous mode.
+
+        One config write starts free-running conversion; each sample is
+        then a single conversion-register read at the rate period,
+        instead of a full config/sleep/read single-shot cycle per
+        sample. Returns to single-shot mode afterwards.
+
+        Args:
+            n: Number of samples to average (>= 1)
+
+        Returns:
+            Mean voltage in volts
+        """
+        config = (_MUX_DIFF_0_1 | self.gain |
+                  _MODE_CONTINUOUS | self.rate | _COMP_DISABLE)
+        self._write_register(_REG_CONFIG, config)
+
+        delay = self._rate_delay
+        time.sleep_ms(delay)
+
+        # Accumulate raw counts; no per-sample list or float work
+        total = self._read_register(_REG_CONVERSION)
+        for _ in range(n - 1):
+            time.sleep_ms(delay)
+            total += self._read_register(_REG_CONVERSION)
+
+        # Back to single-shot so the chip powers down between readings
+        # — unless configure_continuous() owns the chip, which is then
+        # already in exactly the free-running config written above and
+        # must stay there for read_result() consumers
+        if not self.continuous:
+            self._write_register(_REG_CONFIG,
+                                 _MUX_DIFF_0_1 | self.gain |
+                                 _MODE_SINGLE | self.rate | _COMP_DISABLE)
+
+        return total * self._scale / n
+
     def read_diff_2_3(self):
         """Read differential voltage between AIN2 and AIN3 (sensor ID)."""
         raw = self._read_raw(_MUX_DIFF_2_3)
@@ -156,8 +269,8 @@ class ADS1115:
 
     def _raw_to_voltage(self, raw):
         """Convert raw ADC value to voltage."""
-        voltage_range = _PGA_RANGE.get(self.gain, 2.048)
-        return raw * voltage_range / 32767.0
+        # Volts-per-count is fixed by the gain; see set_gain
+        return raw * self._scale
 
     def read_power_voltage(self):
         """Read power sensor voltage (differential A0-A1)."""
@@ -170,7 +283,17 @@ class ADS1115:
     def set_gain(self, gain):
         """Set PGA gain."""
         self.gain = gain
+        self._scale = _PGA_RANGE.get(gain, 2.048) / 32767.0
+        self._base_cfg = (_OS_SINGLE | gain | _MODE_SINGLE |
+                          self.rate | _COMP_DISABLE)
+        if self.continuous:
+            self.configure_continuous()
 
     def set_rate(self, rate):
         """Set data rate."""
         self.rate = rate
+        self._rate_delay = _RATE_DELAY_TBL[(rate >> 5) & 7]
+        self._base_cfg = (_OS_SINGLE | self.gain | _MODE_SINGLE |
+                          rate | _COMP_DISABLE)
+        if self.continuous:
+            self.configure_continuous()
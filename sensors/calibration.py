@@ -1,13 +1,40 @@
 # Calibration Management with EEPROM Storage
 # Reads/writes calibration from sensor module EEPROMs via I2C multiplexer
 
+from array import array
+from collections import deque
+import time
+
 from .tca9548a import TCA9548A
 from .eeprom import SensorEEPROM, EEPROM_DEFAULT_ADDR
 import config
 
+# Optional array backend for block conversions: ulab's numpy on
+# MicroPython builds that bundle it, plain numpy on the host. None
+# falls back to a per-element loop.
+try:
+    from ulab import numpy as _np
+except ImportError:
+    try:
+        import numpy as _np
+    except ImportError:
+        _np = None
+
+# flush() write scheduling: a dirty sensor is written once its
+# accumulated correction change exceeds this (in dB), or once no
+# further change has arrived for the quiesce interval. Keeps rapid
+# UI nudges from triggering an EEPROM write cycle each.
+_FLUSH_DELTA_DB = 0.5
+_FLUSH_QUIESCE_MS = 2000
+
 
 class FrequencyCalibration:
-    """Stores calibration corrections for a specific frequency."""
+    """
+    Stores calibration corrections for a specific frequency.
+
+    Retained for external callers only; SensorCalibration keeps its
+    corrections in parallel arrays internally.
+    """
 
     def __init__(self, frequency_mhz, offset=0.0, slope=1.0):
         """
@@ -43,13 +70,75 @@ class SensorCalibration:
         self.base_intercept = base_intercept
         self.frequencies = frequencies or []
 
+        # Catalog is fixed after load: sorted copy for nearest-match
+        # search, index map for O(1) membership tests and array lookup
+        self._sorted_freqs = sorted(self.frequencies)
+        self._idx = {f: i for i, f in enumerate(self.frequencies)}
+
         # Current operating frequency (defaults to lowest)
         self.current_frequency = frequencies[0] if frequencies else 0
 
-        # Per-frequency calibration corrections
-        self.freq_cal = {}
-        for freq in frequencies:
-            self.freq_cal[freq] = FrequencyCalibration(freq, 0.0, 1.0)
+        # True when corrections changed since the last EEPROM sync;
+        # save() skips clean sensors entirely. The delta/timestamp pair
+        # feeds CalibrationManager.flush()'s write scheduling.
+        self.cal_dirty = False
+        self._pending_delta = 0.0
+        self._last_change_ms = 0
+
+        # Last get_cal_data_for_storage result, rebuilt only after a
+        # correction changes; save()/flush() may poll it repeatedly
+        self._cached_storage = None
+        self._storage_dirty = True
+
+        # Reused by get_sensor_info: static fields filled once, the
+        # frequency-dependent ones refreshed by _recompute. Callers
+        # must treat the returned dict as read-only.
+        self._info_dict = {
+            'type': sensor_type,
+            'serial': serial,
+            'base_slope': base_slope,
+            'base_intercept': base_intercept,
+            'frequencies': self.frequencies,
+            'current_frequency': self.current_frequency,
+            'offset': 0.0,
+            'slope': 1.0,
+        }
+
+        # Per-frequency corrections as parallel arrays indexed through
+        # _idx; 'f' matches the EEPROM's little-endian float storage.
+        # A dict of FrequencyCalibration objects costs an object header
+        # and dict slot per frequency for the same 8 bytes of payload.
+        n = len(self.frequencies)
+        self._offsets = array('f', [0.0] * n)
+        self._slopes = array('f', [1.0] * n)
+
+        self._recompute()
+
+    def _recompute(self):
+        """
+        Fold base and per-frequency corrections into one gain/bias pair.
+
+        voltage_to_dbm runs per ADC sample; collapsing
+        (v / base_slope + base_intercept) * freq_slope + freq_offset
+        into v * gain + bias leaves one multiply and one add there.
+        Called whenever frequency or corrections change.
+        """
+        freq_offset = self.get_offset()
+        freq_slope = self.get_slope()
+
+        info = self._info_dict
+        info['current_frequency'] = self.current_frequency
+        info['offset'] = freq_offset
+        info['slope'] = freq_slope
+
+        self._valid = abs(self.base_slope) >= 0.0001
+        if not self._valid:
+            self._gain = 0.0
+            self._bias = 0.0
+            return
+
+        self._gain = freq_slope / self.base_slope
+        self._bias = self.base_intercept * freq_slope + freq_offset
 
     def get_frequencies(self):
         """Get list of valid calibration frequencies."""
@@ -68,13 +157,34 @@ class SensorCalibration:
         if not self.frequencies:
             return 0
 
-        if freq_mhz in self.frequencies:
+        if freq_mhz in self._idx:
             self.current_frequency = freq_mhz
+            self._recompute()
             return freq_mhz
 
-        # Find closest match
-        closest = min(self.frequencies, key=lambda f: abs(f - freq_mhz))
+        # Binary search the sorted catalog for the insertion point,
+        # then pick the nearer neighbour (MicroPython has no bisect)
+        freqs = self._sorted_freqs
+        lo = 0
+        hi = len(freqs)
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if freqs[mid] < freq_mhz:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo == 0:
+            closest = freqs[0]
+        elif lo == len(freqs):
+            closest = freqs[-1]
+        else:
+            below = freqs[lo - 1]
+            above = freqs[lo]
+            closest = below if freq_mhz - below <= above - freq_mhz else above
+
         self.current_frequency = closest
+        self._recompute()
         return closest
 
     def get_frequency(self):
@@ -84,32 +194,38 @@ class SensorCalibration:
     def set_offset(self, offset, frequency=None):
         """Set calibration offset for a frequency."""
         freq = frequency if frequency is not None else self.current_frequency
-        if freq in self.freq_cal:
-            self.freq_cal[freq].offset = offset
-        elif freq in self.frequencies:
-            self.freq_cal[freq] = FrequencyCalibration(freq, offset, 1.0)
+        i = self._idx.get(freq)
+        if i is not None:
+            self._pending_delta += abs(offset - self._offsets[i])
+            self._offsets[i] = offset
+            self._last_change_ms = time.ticks_ms()
+            self._storage_dirty = True
+        self.cal_dirty = True
+        self._recompute()
 
     def get_offset(self, frequency=None):
         """Get calibration offset for a frequency."""
         freq = frequency if frequency is not None else self.current_frequency
-        if freq in self.freq_cal:
-            return self.freq_cal[freq].offset
-        return 0.0
+        i = self._idx.get(freq)
+        return self._offsets[i] if i is not None else 0.0
 
     def set_slope(self, slope, frequency=None):
         """Set calibration slope for a frequency."""
         freq = frequency if frequency is not None else self.current_frequency
-        if freq in self.freq_cal:
-            self.freq_cal[freq].slope = slope
-        elif freq in self.frequencies:
-            self.freq_cal[freq] = FrequencyCalibration(freq, 0.0, slope)
+        i = self._idx.get(freq)
+        if i is not None:
+            self._pending_delta += abs(slope - self._slopes[i])
+            self._slopes[i] = slope
+            self._last_change_ms = time.ticks_ms()
+            self._storage_dirty = True
+        self.cal_dirty = True
+        self._recompute()
 
     def get_slope(self, frequency=None):
         """Get calibration slope for a frequency."""
         freq = frequency if frequency is not None else self.current_frequency
-        if freq in self.freq_cal:
-            return self.freq_cal[freq].slope
-        return 1.0
+        i = self._idx.get(freq)
+        return self._slopes[i] if i is not None else 1.0
 
     def voltage_to_dbm(self, voltage):
         """
@@ -121,36 +237,111 @@ class SensorCalibration:
         Returns:
             Power in dBm
         """
-        if abs(self.base_slope) < 0.0001:
+        if not self._valid:
             return 0.0
 
-        # Base conversion
-        raw_dbm = (voltage / self.base_slope) + self.base_intercept
+        # Folded form of base conversion plus frequency corrections;
+        # see _recompute
+        return voltage * self._gain + self._bias
 
-        # Apply frequency-dependent corrections
-        freq_offset = self.get_offset()
-        freq_slope = self.get_slope()
+    def voltage_to_dbm_array(self, voltages):
+        """
+        Convert a block of sensor voltages to powers in dBm.
 
-        return (raw_dbm * freq_slope) + freq_offset
+        Broadcasts the folded gain/bias over the whole block when an
+        array backend is available, avoiding a Python-level call per
+        sample.
+
+        Args:
+            voltages: Sequence (or ndarray) of voltages
+
+        Returns:
+            ndarray of powers, or a list when no backend is present
+        """
+        if not self._valid:
+            if _np is not None:
+                return _np.zeros(len(voltages))
+            return [0.0] * len(voltages)
+
+        gain = self._gain
+        bias = self._bias
+        if _np is not None:
+            return _np.array(voltages) * gain + bias
+        return [v * gain + bias for v in voltages]
 
     def get_cal_data_for_storage(self):
         """Get calibration data in format for EEPROM storage."""
+        if not self._storage_dirty:
+            return self._cached_storage
+
         cal_data = {}
-        for freq, cal in self.freq_cal.items():
-            if abs(cal.offset) > 0.001 or abs(cal.slope - 1.0) > 0.001:
-                cal_data[freq] = {'offset': cal.offset, 'slope': cal.slope}
+        offsets = self._offsets
+        slopes = self._slopes
+        for freq, i in self._idx.items():
+            offset = offsets[i]
+            slope = slopes[i]
+            if abs(offset) > 0.001 or abs(slope - 1.0) > 0.001:
+                cal_data[freq] = {'offset': offset, 'slope': slope}
+
+        self._cached_storage = cal_data
+        self._storage_dirty = False
         return cal_data
 
     def load_cal_data(self, cal_data):
         """Load calibration data from EEPROM format."""
         for freq, cal in cal_data.items():
             freq_int = int(freq) if isinstance(freq, str) else freq
-            if freq_int in self.frequencies:
-                self.freq_cal[freq_int] = FrequencyCalibration(
-                    freq_int,
-                    cal.get('offset', 0.0),
-                    cal.get('slope', 1.0)
-                )
+            i = self._idx.get(freq_int)
+            if i is not None:
+                self._offsets[i] = cal.get('offset', 0.0)
+                self._slopes[i] = cal.get('slope', 1.0)
+        self._storage_dirty = True
+        self._recompute()
+
+
+class _NullSensor:
+    """
+    Stand-in for an absent sensor.
+
+    CalibrationManager.sensor() returns this singleton when no sensor
+    is loaded, so callers — and the manager's own proxies — can invoke
+    the SensorCalibration read API unconditionally and get the usual
+    defaults back, without a presence branch per call.
+    """
+
+    sensor_type = None
+    serial = None
+    _info_dict = None
+
+    def set_frequency(self, freq_mhz):
+        return None
+
+    def get_frequency(self):
+        return None
+
+    def get_frequencies(self):
+        return []
+
+    def set_offset(self, offset, frequency=None):
+        pass
+
+    def get_offset(self, frequency=None):
+        return 0.0
+
+    def set_slope(self, slope, frequency=None):
+        pass
+
+    def get_slope(self, frequency=None):
+        return 1.0
+
+    def voltage_to_dbm(self, voltage):
+        return None
+
+    def voltage_to_dbm_array(self, voltages):
+        return None
+
+
+_NO_SENSOR = _NullSensor()
 
 
 class CalibrationManager:
@@ -169,16 +360,25 @@ class CalibrationManager:
         self.mux_address = mux_address or config.MUX_ADDRESS
         self.eeprom_address = eeprom_address or EEPROM_DEFAULT_ADDR
 
+        # Bounded error-event queue, drained by the main loop; printing
+        # from inside save() would block the write path on the UART
+        self._errors = deque((), 16)
+
         # Initialize multiplexer
         try:
             self.mux = TCA9548A(i2c, self.mux_address)
         except RuntimeError as e:
-            print("Warning: Multiplexer not found:", e)
+            self._errors.append(('mux_missing', 0, str(e)))
             self.mux = None
 
         # Calibration data per channel
         self.sensors = {1: None, 2: None}  # SensorCalibration per channel
 
+        # One EEPROM driver per channel (same bus address behind the
+        # mux); reusing them keeps their header caches and avoids an
+        # allocation per access
+        self._eeproms = {}
+
         # Channel to multiplexer mapping
         self.channel_mux_map = {
             1: config.MUX_CHANNEL_1,
@@ -197,30 +397,45 @@ class CalibrationManager:
         self.mux.select_channel(mux_channel)
         return True
 
-    def _get_eeprom(self):
-        """Get EEPROM driver (after selecting channel)."""
-        return SensorEEPROM(self.i2c, self.eeprom_address)
+    def _get_eeprom(self, channel):
+        """Get EEPROM driver for channel (after selecting it)."""
+        eeprom = self._eeproms.get(channel)
+        if eeprom is None:
+            eeprom = SensorEEPROM(self.i2c, self.eeprom_address)
+            self._eeproms[channel] = eeprom
+        return eeprom
 
-    def detect_sensor(self, channel):
+    def detect_sensor(self, channel, deselect=True):
         """
         Detect and load sensor on specified channel.
 
         Args:
             channel: Channel number (1 or 2)
+            deselect: Disable the mux afterwards (callers probing
+                several channels back to back can skip this; the next
+                select overwrites the control register anyway)
 
         Returns:
             Sensor type string or None if not detected
         """
-        if not self._select_sensor(channel):
+        if self.mux is None:
             return None
-
-        eeprom = self._get_eeprom()
-
-        if not eeprom.is_present():
-            self.sensors[channel] = None
+        mux_channel = self.channel_mux_map.get(channel)
+        if mux_channel is None:
             return None
 
-        # Read sensor info from EEPROM
+        # Do all Python-side preparation before touching the bus so
+        # the mux select is immediately followed by the EEPROM read,
+        # with no allocation or lookups widening the idle gap between
+        # the two transactions. Detection runs on presence changes, so
+        # the module behind the mux may have been swapped since the
+        # header was cached.
+        eeprom = self._get_eeprom(channel)
+        eeprom.invalidate_cache()
+
+        self.mux.select_channel(mux_channel)
+        # A missing device fails the header read with OSError, so no
+        # separate presence probe
         info = eeprom.read_sensor_info()
         if info is None:
             self.sensors[channel] = None
@@ -240,7 +455,8 @@ class CalibrationManager:
         self.sensors[channel].load_cal_data(cal_data)
 
         # Disable mux channel when done
-        self.mux.disable_all()
+        if deselect:
+            self.mux.disable_all()
 
         return info['type']
 
@@ -248,77 +464,86 @@ class CalibrationManager:
         """Detect sensors on all channels."""
         results = {}
         for channel in [1, 2]:
-            sensor_type = self.detect_sensor(channel)
+            sensor_type = self.detect_sensor(channel, deselect=False)
             results[channel] = sensor_type
+        if self.mux:
+            self.mux.disable_all()
         return results
 
+    def sensor(self, channel):
+        """
+        Get the SensorCalibration for channel, or a null object with
+        the same read API and default returns if none is loaded.
+
+        Hot-path callers should bind the result once outside their
+        loop rather than going through the per-channel proxies below.
+        """
+        return self.sensors.get(channel) or _NO_SENSOR
+
     def get_sensor(self, channel):
-        """Get sensor calibration for channel."""
+        """Get sensor calibration for channel (None if absent)."""
         return self.sensors.get(channel)
 
     def get_sensor_type(self, channel):
         """Get detected sensor type for channel."""
-        sensor = self.sensors.get(channel)
-        return sensor.sensor_type if sensor else None
+        return self.sensor(channel).sensor_type
 
     def get_sensor_serial(self, channel):
         """Get sensor serial number for channel."""
-        sensor = self.sensors.get(channel)
-        return sensor.serial if sensor else None
+        return self.sensor(channel).serial
 
     def set_frequency(self, channel, freq_mhz):
         """Set operating frequency for channel."""
-        sensor = self.sensors.get(channel)
-        if sensor:
-            return sensor.set_frequency(freq_mhz)
-        return None
+        return self.sensor(channel).set_frequency(freq_mhz)
 
     def get_frequency(self, channel):
         """Get current frequency for channel."""
-        sensor = self.sensors.get(channel)
-        if sensor:
-            return sensor.get_frequency()
-        return None
+        return self.sensor(channel).get_frequency()
 
     def get_frequencies(self, channel):
         """Get list of valid frequencies for channel."""
-        sensor = self.sensors.get(channel)
-        if sensor:
-            return sensor.get_frequencies()
-        return []
+        return self.sensor(channel).get_frequencies()
 
     def set_offset(self, channel, offset, frequency=None):
         """Set calibration offset for channel at frequency."""
-        sensor = self.sensors.get(channel)
-        if sensor:
-            sensor.set_offset(offset, frequency)
+        self.sensor(channel).set_offset(offset, frequency)
 
     def get_offset(self, channel, frequency=None):
         """Get calibration offset for channel at frequency."""
-        sensor = self.sensors.get(channel)
-        if sensor:
-            return sensor.get_offset(frequency)
-        return 0.0
+        return self.sensor(channel).get_offset(frequency)
 
     def set_slope(self, channel, slope, frequency=None):
         """Set calibration slope for channel at frequency."""
-        sensor = self.sensors.get(channel)
-        if sensor:
-            sensor.set_slope(slope, frequency)
+        self.sensor(channel).set_slope(slope, frequency)
 
     def get_slope(self, channel, frequency=None):
         """Get calibration slope for channel at frequency."""
-        sensor = self.sensors.get(channel)
-        if sensor:
-            return sensor.get_slope(frequency)
-        return 1.0
+        return self.sensor(channel).get_slope(frequency)
 
     def voltage_to_dbm(self, channel, voltage):
         """Convert voltage to dBm for specified channel."""
-        sensor = self.sensors.get(channel)
-        if sensor:
-            return sensor.voltage_to_dbm(voltage)
-        return None
+        return self.sensor(channel).voltage_to_dbm(voltage)
+
+    def voltage_to_dbm_array(self, channel, voltages):
+        """Convert a block of voltages to dBm for specified channel."""
+        return self.sensor(channel).voltage_to_dbm_array(voltages)
+
+    def voltages_to_dbm_pair(self, v1, v2):
+        """
+        Convert one voltage per channel in a single call.
+
+        The read loop converts both channels every tick; fusing the
+        two proxy calls into one saves a Python call and the second
+        channel lookup. Absent channels yield None.
+
+        Returns:
+            (dbm1, dbm2) tuple
+        """
+        sensors = self.sensors
+        s1 = sensors.get(1)
+        s2 = sensors.get(2)
+        return (s1.voltage_to_dbm(v1) if s1 else None,
+                s2.voltage_to_dbm(v2) if s2 else None)
 
     def save(self, channel=None):
         """
@@ -335,19 +560,23 @@ class CalibrationManager:
 
         for ch in channels:
             sensor = self.sensors.get(ch)
-            if sensor is None:
+            if sensor is None or not sensor.cal_dirty:
                 continue
 
+            # Pack the payload before selecting so the mux write and
+            # the EEPROM page writes run back to back
+            eeprom = self._get_eeprom(ch)
+            cal_data = sensor.get_cal_data_for_storage()
+
             if not self._select_sensor(ch):
                 success = False
                 continue
 
             try:
-                eeprom = self._get_eeprom()
-                cal_data = sensor.get_cal_data_for_storage()
                 eeprom.write_calibration(cal_data)
+                sensor.cal_dirty = False
             except OSError as e:
-                print("Error saving calibration for channel {}: {}".format(ch, e))
+                self._errors.append(('save_fail', ch, str(e)))
                 success = False
 
         if self.mux:
@@ -355,6 +584,38 @@ class CalibrationManager:
 
         return success
 
+    def pop_errors(self):
+        """
+        Drain and return queued error events.
+
+        Each event is an (event, channel, message) tuple; the queue
+        drops the oldest entry when full.
+        """
+        errors = []
+        while self._errors:
+            errors.append(self._errors.popleft())
+        return errors
+
+    def flush(self, force=False):
+        """
+        Write dirty calibration to EEPROM when it is worth the cycles.
+
+        A sensor is flushed once its accumulated correction change
+        exceeds _FLUSH_DELTA_DB, once _FLUSH_QUIESCE_MS has passed
+        without further changes, or unconditionally with force=True.
+        Meant to be called periodically from the main loop; explicit
+        CAL:SAVE commands still go through save() directly.
+        """
+        now = time.ticks_ms()
+        for ch, sensor in self.sensors.items():
+            if sensor is None or not sensor.cal_dirty:
+                continue
+            if (force or sensor._pending_delta > _FLUSH_DELTA_DB or
+                    time.ticks_diff(now, sensor._last_change_ms)
+                    > _FLUSH_QUIESCE_MS):
+                if self.save(ch):
+                    sensor._pending_delta = 0.0
+
     def restore_defaults(self, channel):
         """
         Restore default calibration for channel.
@@ -363,26 +624,23 @@ class CalibrationManager:
         """
         sensor = self.sensors.get(channel)
         if sensor:
-            # Reset all frequency calibrations to default
-            for freq in sensor.frequencies:
-                sensor.freq_cal[freq] = FrequencyCalibration(freq, 0.0, 1.0)
+            # Reset all frequency calibrations to default, in place
+            for i in range(len(sensor._offsets)):
+                sensor._offsets[i] = 0.0
+                sensor._slopes[i] = 1.0
+            sensor.cal_dirty = True
+            sensor._storage_dirty = True
+            sensor._recompute()
             # Save cleared calibration to EEPROM
             self.save(channel)
             return True
         return False
 
     def get_sensor_info(self, channel):
-        """Get full sensor information for channel."""
-        sensor = self.sensors.get(channel)
-        if sensor:
-            return {
-                'type': sensor.sensor_type,
-                'serial': sensor.serial,
-                'base_slope': sensor.base_slope,
-                'base_intercept': sensor.base_intercept,
-                'frequencies': sensor.frequencies,
-                'current_frequency': sensor.current_frequency,
-                'offset': sensor.get_offset(),
-                'slope': sensor.get_slope(),
-            }
-        return None
+        """
+        Get full sensor information for channel.
+
+        Returns the sensor's reusable info dict (do not mutate), kept
+        current by _recompute, or None if no sensor is present.
+        """
+        return self.sensor(channel)._info_dict
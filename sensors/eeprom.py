@@ -47,18 +47,60 @@ class SensorEEPROM:
         """
         self.i2c = i2c
         self.address = address
+        # Parsed header cache; the EEPROM contents never change during
+        # a session except through this driver, which invalidates it
+        self._info_cache = None
+        # Packed image of the calibration block as last read/written;
+        # lets write_calibration skip writes that would change nothing
+        self._last_cal_bytes = None
+        # Wire buffer for page writes (address byte + one page),
+        # reused so the write path allocates nothing per page
+        self._scratch = bytearray(EEPROM_PAGE_SIZE + 1)
+
+    def invalidate_cache(self):
+        """Drop the cached header (e.g. after a sensor swap)."""
+        self._info_cache = None
+        self._last_cal_bytes = None
+
+    def _wait_write_complete(self, timeout_ms=6):
+        """
+        Wait for the internal write cycle using ACK polling.
+
+        The AT24Cxx NACKs its own address while a write cycle is in
+        progress (typically 2-3 ms) and ACKs once done, so polling
+        returns as soon as the chip is ready instead of sleeping the
+        5 ms worst case every time.
+        """
+        deadline = time.ticks_add(time.ticks_ms(), timeout_ms)
+        while True:
+            try:
+                self.i2c.writeto(self.address, b'')
+                return
+            except OSError:
+                if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+                    return
+                time.sleep_us(200)
 
     def _write_byte(self, addr, data):
         """Write a single byte to EEPROM."""
-        self.i2c.writeto(self.address, bytes([addr, data]))
-        time.sleep_ms(5)  # Write cycle time
+        scratch = self._scratch
+        scratch[0] = addr
+        scratch[1] = data
+        self.i2c.writeto(self.address, memoryview(scratch)[:2])
+        self._wait_write_complete()
 
     def _write_page(self, addr, data):
         """Write up to 8 bytes (one page) to EEPROM."""
-        if len(data) > EEPROM_PAGE_SIZE:
+        n = len(data)
+        if n > EEPROM_PAGE_SIZE:
             raise ValueError("Data exceeds page size")
-        self.i2c.writeto(self.address, bytes([addr]) + data)
-        time.sleep_ms(5)  # Write cycle time
+        # Assemble the frame in the reused scratch buffer instead of
+        # concatenating fresh bytes objects per page
+        scratch = self._scratch
+        scratch[0] = addr
+        scratch[1:1 + n] = data
+        self.i2c.writeto(self.address, memoryview(scratch)[:1 + n])
+        self._wait_write_complete()
 
     def _read_bytes(self, addr, length):
         """Read bytes from EEPROM."""
@@ -67,16 +109,20 @@ class SensorEEPROM:
 
     def write_bytes(self, addr, data):
         """Write data to EEPROM, handling page boundaries."""
-        data = bytes(data)
+        # Page chunks are cut from a memoryview, so only the page-sized
+        # wire buffer is copied per write; ACK polling in _write_page
+        # keeps the inter-page gap as short as the chip allows
+        mv = memoryview(data)
+        total = len(data)
         offset = 0
 
-        while offset < len(data):
-            # Calculate bytes until page boundary
+        while offset < total:
+            # Bytes until page boundary
             page_offset = (addr + offset) % EEPROM_PAGE_SIZE
-            bytes_to_write = min(EEPROM_PAGE_SIZE - page_offset, len(data) - offset)
+            n = min(EEPROM_PAGE_SIZE - page_offset, total - offset)
 
-            self._write_page(addr + offset, data[offset:offset + bytes_to_write])
-            offset += bytes_to_write
+            self._write_page(addr + offset, mv[offset:offset + n])
+            offset += n
 
     def is_valid(self):
         """Check if EEPROM contains valid sensor data."""
@@ -101,45 +147,41 @@ class SensorEEPROM:
         Returns:
             Dict with sensor info or None if invalid
         """
-        if not self.is_valid():
-            return None
+        if self._info_cache is not None:
+            return self._info_cache
 
         try:
-            # Read header
-            version = self._read_bytes(OFF_VERSION, 1)[0]
-            if version != FORMAT_VERSION:
-                return None
-
-            # Read sensor type
-            type_len = self._read_bytes(OFF_TYPE_LEN, 1)[0]
-            sensor_type = self._read_bytes(OFF_TYPE, type_len).decode('utf-8')
+            # The whole fixed header fits one transaction; per-field
+            # reads cost a START/STOP pair each on the shared bus
+            raw = self._read_bytes(OFF_MAGIC, OFF_CAL_DATA)
 
-            # Read serial number
-            serial_len = self._read_bytes(OFF_SERIAL_LEN, 1)[0]
-            serial = self._read_bytes(OFF_SERIAL, serial_len).decode('utf-8')
+            if raw[OFF_MAGIC:OFF_MAGIC + 4] != MAGIC:
+                return None
+            if raw[OFF_VERSION] != FORMAT_VERSION:
+                return None
 
-            # Read base calibration
-            slope_bytes = self._read_bytes(OFF_SLOPE, 4)
-            slope = struct.unpack('<f', slope_bytes)[0]
+            # Sensor type and serial number
+            type_len = raw[OFF_TYPE_LEN]
+            sensor_type = raw[OFF_TYPE:OFF_TYPE + type_len].decode('utf-8')
+            serial_len = raw[OFF_SERIAL_LEN]
+            serial = raw[OFF_SERIAL:OFF_SERIAL + serial_len].decode('utf-8')
 
-            intercept_bytes = self._read_bytes(OFF_INTERCEPT, 4)
-            intercept = struct.unpack('<f', intercept_bytes)[0]
+            # Base calibration; slope and intercept are adjacent
+            slope, intercept = struct.unpack_from('<ff', raw, OFF_SLOPE)
 
-            # Read frequencies
-            num_freqs = self._read_bytes(OFF_NUM_FREQS, 1)[0]
-            freq_bytes = self._read_bytes(OFF_FREQS, num_freqs * 2)
-            frequencies = []
-            for i in range(num_freqs):
-                freq = struct.unpack('<H', freq_bytes[i*2:i*2+2])[0]
-                frequencies.append(freq)
+            # Frequencies decoded in one unpack call
+            num_freqs = raw[OFF_NUM_FREQS]
+            frequencies = list(struct.unpack_from(
+                '<%dH' % num_freqs, raw, OFF_FREQS))
 
-            return {
+            self._info_cache = {
                 'type': sensor_type,
                 'serial': serial,
                 'slope': slope,
                 'intercept': intercept,
                 'frequencies': frequencies,
             }
+            return self._info_cache
         except (OSError, UnicodeError, struct.error):
             return None
 
@@ -158,17 +200,19 @@ class SensorEEPROM:
             num_entries = self._read_bytes(OFF_CAL_DATA, 1)[0]
 
             if num_entries == 0 or num_entries > MAX_CAL_ENTRIES:
+                if num_entries == 0:
+                    self._last_cal_bytes = b'\x00'
                 return cal_data
 
-            # Read calibration entries
-            for i in range(num_entries):
-                entry_addr = OFF_CAL_DATA + 1 + (i * CAL_ENTRY_SIZE)
-                entry_bytes = self._read_bytes(entry_addr, CAL_ENTRY_SIZE)
-
-                freq = struct.unpack('<H', entry_bytes[0:2])[0]
-                offset = struct.unpack('<f', entry_bytes[2:6])[0]
-                slope = struct.unpack('<f', entry_bytes[6:10])[0]
+            # All entries are contiguous; one bulk read replaces a
+            # pointer-write/read transaction pair per entry
+            buf = self._read_bytes(OFF_CAL_DATA + 1,
+                                   num_entries * CAL_ENTRY_SIZE)
+            self._last_cal_bytes = bytes([num_entries]) + buf
 
+            for i in range(num_entries):
+                freq, offset, slope = struct.unpack_from(
+                    '<Hff', buf, i * CAL_ENTRY_SIZE)
                 cal_data[freq] = {'offset': offset, 'slope': slope}
 
         except (OSError, struct.error):
@@ -191,33 +235,35 @@ class SensorEEPROM:
         serial = serial[:12]
         frequencies = frequencies[:MAX_FREQUENCIES]
 
-        # Write magic and version
-        self.write_bytes(OFF_MAGIC, MAGIC)
-        self._write_byte(OFF_VERSION, FORMAT_VERSION)
+        # Assemble the whole header plus the empty cal-entry count in
+        # RAM and emit it as one page-chunked write. The piecemeal
+        # version paid a full 5 ms write cycle for every length and
+        # version byte; here adjacent fields share page cycles.
+        buf = bytearray(b'\xff' * (OFF_CAL_DATA + 1))
+
+        buf[OFF_MAGIC:OFF_MAGIC + 4] = MAGIC
+        buf[OFF_VERSION] = FORMAT_VERSION
 
-        # Write sensor type
         type_bytes = sensor_type.encode('utf-8')
-        self._write_byte(OFF_TYPE_LEN, len(type_bytes))
-        self.write_bytes(OFF_TYPE, type_bytes)
+        buf[OFF_TYPE_LEN] = len(type_bytes)
+        buf[OFF_TYPE:OFF_TYPE + len(type_bytes)] = type_bytes
 
-        # Write serial
         serial_bytes = serial.encode('utf-8')
-        self._write_byte(OFF_SERIAL_LEN, len(serial_bytes))
-        self.write_bytes(OFF_SERIAL, serial_bytes)
+        buf[OFF_SERIAL_LEN] = len(serial_bytes)
+        buf[OFF_SERIAL:OFF_SERIAL + len(serial_bytes)] = serial_bytes
 
-        # Write base calibration
-        self.write_bytes(OFF_SLOPE, struct.pack('<f', slope))
-        self.write_bytes(OFF_INTERCEPT, struct.pack('<f', intercept))
+        struct.pack_into('<ff', buf, OFF_SLOPE, slope, intercept)
 
-        # Write frequencies
-        self._write_byte(OFF_NUM_FREQS, len(frequencies))
-        freq_bytes = b''
-        for freq in frequencies:
-            freq_bytes += struct.pack('<H', freq)
-        self.write_bytes(OFF_FREQS, freq_bytes)
+        buf[OFF_NUM_FREQS] = len(frequencies)
+        struct.pack_into('<%dH' % len(frequencies), buf, OFF_FREQS,
+                         *frequencies)
 
-        # Initialize calibration data area (0 entries)
-        self._write_byte(OFF_CAL_DATA, 0)
+        # Calibration data area starts with 0 entries
+        buf[OFF_CAL_DATA] = 0
+
+        self._info_cache = None
+        self.write_bytes(0, buf)
+        self._last_cal_bytes = b'\x00'
 
     def write_calibration(self, cal_data):
         """
@@ -238,17 +284,28 @@ class SensorEEPROM:
         if len(entries) > MAX_CAL_ENTRIES:
             entries = entries[:MAX_CAL_ENTRIES]
 
-        # Write number of entries
-        self._write_byte(OFF_CAL_DATA, len(entries))
-
-        # Write each entry
+        # Pack count byte and all entries contiguously; write_bytes
+        # chunks by page, so the number of 5 ms write cycles scales
+        # with total bytes rather than entry count
+        buf = bytearray(1 + len(entries) * CAL_ENTRY_SIZE)
+        buf[0] = len(entries)
         for i, (freq, offset, slope) in enumerate(entries):
-            entry_addr = OFF_CAL_DATA + 1 + (i * CAL_ENTRY_SIZE)
-            entry_bytes = struct.pack('<H', freq) + struct.pack('<f', offset) + struct.pack('<f', slope)
-            self.write_bytes(entry_addr, entry_bytes)
+            struct.pack_into('<Hff', buf, 1 + i * CAL_ENTRY_SIZE,
+                             freq, offset, slope)
+
+        # Identical image: skip the write cycles and spare the cell
+        # endurance (AT24C02 is rated for ~1M cycles)
+        packed = bytes(buf)
+        if packed == self._last_cal_bytes:
+            return
+
+        self.write_bytes(OFF_CAL_DATA, buf)
+        self._last_cal_bytes = packed
 
     def erase(self):
         """Erase EEPROM (fill with 0xFF)."""
+        self._info_cache = None
+        self._last_cal_bytes = None
         for addr in range(0, EEPROM_SIZE, EEPROM_PAGE_SIZE):
             self._write_page(addr, bytes([0xFF] * EEPROM_PAGE_SIZE))
 
@@ -2,6 +2,9 @@
 # Handles ADC reading, averaging, and power calculation
 
 import uasyncio as asyncio
+import micropython
+from array import array
+from math import exp
 from machine import Pin
 from .ads1115 import ADS1115, PGA_4_096V
 from .calibration import CalibrationManager
@@ -13,15 +16,31 @@ UNIT_DBW = "DBW"
 UNIT_MW = "MW"
 UNIT_W = "W"
 
+# Display strings indexed by unit id (see _UNIT_IDS)
+UNIT_STRINGS = ("dBm", "dBW", "mW", "W")
+_UNIT_IDS = {UNIT_DBM: 0, UNIT_DBW: 1, UNIT_MW: 2, UNIT_W: 3}
+
+_NAN = float('nan')
+
+# Returned by reference from check_presence_changes when nothing is
+# pending, so the per-tick fast path allocates no dict. Never mutate.
+_EMPTY_DICT = {}
+
+# ln(10)/10: 10 ** (dbm/10) == exp(dbm * ln(10)/10), but exp() is a
+# single C call where ** dispatches through generic pow. The watt
+# conversion folds the -30 dB shift into a constant factor (1e-3).
+_LN10_OVER_10 = 0.23025850929940458
+_DBW_SCALE = exp(-30.0 * _LN10_OVER_10)
+
 
 def dbm_to_mw(dbm):
     """Convert dBm to milliwatts."""
-    return 10.0 ** (dbm / 10.0)
+    return exp(dbm * _LN10_OVER_10)
 
 
 def dbm_to_w(dbm):
     """Convert dBm to watts."""
-    return 10.0 ** ((dbm - 30.0) / 10.0)
+    return _DBW_SCALE * exp(dbm * _LN10_OVER_10)
 
 
 def dbm_to_dbw(dbm):
@@ -29,6 +48,17 @@ def dbm_to_dbw(dbm):
     return dbm - 30.0
 
 
+# (converter, unit string) per unit; one dict probe in get_power
+# replaces a string-compare ladder. None marks the dBm identity case
+# so the common path skips even the converter call.
+_UNIT_CONVERTERS = {
+    UNIT_DBM: (None, "dBm"),
+    UNIT_DBW: (dbm_to_dbw, "dBW"),
+    UNIT_MW: (dbm_to_mw, "mW"),
+    UNIT_W: (dbm_to_w, "W"),
+}
+
+
 class PowerChannel:
     """Represents a single power measurement channel."""
 
@@ -54,8 +84,19 @@ class PowerChannel:
         self.power_voltage = 0.0
         self.power_dbm = None
 
-        # Averaging buffer
-        self._samples = []
+        # Bound SensorCalibration (or the manager's null object),
+        # resolved lazily so the per-sample path skips the manager
+        # lookup; dropped on sensor attach/detach via invalidate_cal
+        self._cal_sensor = None
+
+        # Averaging: fixed circular buffer plus running sum. Push and
+        # evict are O(1); the old list form paid an O(N) pop(0) memmove
+        # and a full sum() traversal per sample. Sized for the maximum
+        # averaging count so set_averaging never reallocates.
+        self._buf = array('f', [0.0] * 256)
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
 
     @property
     def sensor_type(self):
@@ -87,6 +128,23 @@ class PowerChannel:
         """Get list of valid calibration frequencies for this sensor."""
         return self.cal_mgr.get_frequencies(self.channel_num)
 
+    def calibration(self):
+        """
+        Get this channel's SensorCalibration (cached).
+
+        Frequency and correction changes mutate the same object, so
+        only a sensor swap — which replaces it — needs invalidate_cal.
+        """
+        sensor = self._cal_sensor
+        if sensor is None:
+            sensor = self.cal_mgr.sensor(self.channel_num)
+            self._cal_sensor = sensor
+        return sensor
+
+    def invalidate_cal(self):
+        """Drop the bound calibration object (sensor attach/detach)."""
+        self._cal_sensor = None
+
     def read_voltage(self):
         """Read power sensor voltage from ADC."""
         self.power_voltage = self.adc.read_power_voltage()
@@ -100,22 +158,44 @@ class PowerChannel:
             Power in dBm or None if sensor not detected
         """
         # Read voltage
-        self.power_voltage = self.adc.read_power_voltage()
-
-        # Update averaging buffer
-        self._samples.append(self.power_voltage)
-        if len(self._samples) > self.averaging:
-            self._samples.pop(0)
+        v = self.adc.read_power_voltage()
+        self.power_voltage = v
 
-        # Calculate average voltage
-        avg_voltage = sum(self._samples) / len(self._samples)
+        avg_voltage = self._push_and_average(v)
 
-        # Convert to dBm
-        self.power_dbm = self.cal_mgr.voltage_to_dbm(
-            self.channel_num, avg_voltage
-        )
+        # Convert to dBm through the bound calibration
+        self.power_dbm = self.calibration().voltage_to_dbm(avg_voltage)
         return self.power_dbm
 
+    @micropython.native
+    def _push_and_average(self, v):
+        """
+        Push one sample into the ring and return the window average.
+
+        Replaces the sample from one window ago and adjusts the running
+        sum by the difference; dividing by the fill count (not capacity)
+        keeps a part-filled window unbiased. Runs per sample, so it is
+        emitted as native code and touches only hoisted locals and the
+        ring — _buf must stay array('f') for the emitter to produce
+        tight indexed stores.
+        """
+        buf = self._buf
+        head = self._head
+        count = self._count
+        n = self.averaging
+        if count == n:
+            old = buf[head]
+        else:
+            old = 0.0
+            count += 1
+            self._count = count
+        buf[head] = v
+        s = self._sum + (v - old)
+        self._sum = s
+        head += 1
+        self._head = 0 if head >= n else head
+        return s / count
+
     def get_power(self, unit=None, include_attenuator=True):
         """
         Get power in specified unit.
@@ -137,30 +217,73 @@ class PowerChannel:
 
         target_unit = unit or self.unit
 
-        if target_unit == UNIT_DBM:
-            return corrected_dbm, "dBm"
-        elif target_unit == UNIT_DBW:
-            return dbm_to_dbw(corrected_dbm), "dBW"
-        elif target_unit == UNIT_MW:
-            return dbm_to_mw(corrected_dbm), "mW"
-        elif target_unit == UNIT_W:
-            return dbm_to_w(corrected_dbm), "W"
+        conv = _UNIT_CONVERTERS.get(target_unit)
+        if conv is None:
+            conv = _UNIT_CONVERTERS[UNIT_DBM]
+        fn, unit_str = conv
+        if fn is None:
+            return corrected_dbm, unit_str
+        return fn(corrected_dbm), unit_str
+
+    def publish_to(self, powers, unit_ids, idx):
+        """
+        Publish the latest converted reading into shared arrays.
+
+        Writes one float and one unit id instead of allocating the
+        (value, unit) tuple get_power() returns. NaN marks no reading.
+
+        Args:
+            powers: array('f') of latest power values
+            unit_ids: array('B') of unit ids (index into UNIT_STRINGS)
+            idx: Slot index for this channel
+        """
+        uid = _UNIT_IDS.get(self.unit, 0)
+        unit_ids[idx] = uid
+        if self.power_dbm is None:
+            powers[idx] = _NAN
+            return
+        dbm = self.power_dbm + self.attenuator
+        if uid == 0:
+            powers[idx] = dbm
+        elif uid == 1:
+            powers[idx] = dbm_to_dbw(dbm)
+        elif uid == 2:
+            powers[idx] = dbm_to_mw(dbm)
         else:
-            return corrected_dbm, "dBm"
+            powers[idx] = dbm_to_w(dbm)
 
     def set_averaging(self, samples):
         """Set number of samples for averaging."""
         self.averaging = max(1, min(256, samples))
-        self._samples = []  # Clear buffer on change
+        self.clear_averaging()  # Window size changed; restart
 
     def set_unit(self, unit):
         """Set default power unit."""
-        if unit in [UNIT_DBM, UNIT_DBW, UNIT_MW, UNIT_W]:
+        if unit in _UNIT_CONVERTERS:
             self.unit = unit
 
     def clear_averaging(self):
         """Clear averaging buffer."""
-        self._samples = []
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+
+    def samples_view(self):
+        """
+        Zero-copy view of the filled part of the averaging ring.
+
+        Samples are in ring order, not arrival order: once the window
+        has wrapped, the oldest sample sits at head_index(). Readers
+        wanting chronological order concatenate view[head:] and
+        view[:head] — both memoryview slices, still no copy; bytes()
+        only when actually serialized. The ring is overwritten in
+        place, so the view is only valid until the next sample.
+        """
+        return memoryview(self._buf)[:self._count]
+
+    def head_index(self):
+        """Ring index of the next write (oldest sample once full)."""
+        return self._head
 
     def set_attenuator(self, value_db):
         """
@@ -202,12 +325,31 @@ class PowerMeter:
             2: PowerChannel(2, self.adc2, self.cal_mgr),
         }
 
-        # Measurement state
+        # Free-running conversion: the 128 SPS period (~8 ms) is well
+        # under the 50 ms read tick, so the conversion register always
+        # holds a fresh sample and each tick is a single 2-byte read
+        # per ADC with no config write or conversion wait
+        self.adc1.configure_continuous()
+        self.adc2.configure_continuous()
+
+        # Latest published readings (SoA): one float and one unit id per
+        # channel, read by the display task without tuple allocation.
+        # NaN means no reading yet.
+        self._latest_power = array('f', [_NAN, _NAN])
+        self._latest_unit_id = array('B', [0, 0])
+
+        # Measurement state; _run mirrors running as a bytearray flag
+        # so read_task's loop test indexes a prebound local instead of
+        # doing an attribute lookup per pass
         self.running = False
+        self._run = bytearray(1)
         self._task = None
 
-        # Hot-swap detection state (pending re-detection flags)
-        self._detect_pending = {1: False, 2: False}
+        # Hot-swap detection state: bit (1 << channel) set from the
+        # presence IRQ, cleared by check_presence_changes. A single
+        # integer makes the idle check one zero test and the ISR
+        # update one OR — both single bytecodes, so no lock is needed.
+        self._pending = 0
 
         # Initialize presence detect pins with pull-down and IRQ
         self._detect_pins = {}
@@ -220,29 +362,25 @@ class PowerMeter:
             2: config.DETECT_PIN_CH2,
         }
 
+        # One shared bound handler for all pins; the channel comes from
+        # a pin-identity lookup instead of a per-pin closure, which
+        # keeps the ISR small and avoids closure-cell allocation
+        self._pin_to_channel = {}
         for channel, pin_num in pin_map.items():
             pin = Pin(pin_num, Pin.IN, Pin.PULL_DOWN)
             self._detect_pins[channel] = pin
-
-            # Create closure to capture channel number
-            def make_handler(ch):
-                def handler(p):
-                    self._on_presence_change(ch, p.value())
-                return handler
-
+            self._pin_to_channel[pin] = channel
             pin.irq(trigger=Pin.IRQ_RISING | Pin.IRQ_FALLING,
-                    handler=make_handler(channel))
+                    handler=self._irq_handler)
 
-    def _on_presence_change(self, channel, present):
+    def _irq_handler(self, pin):
         """
-        Handle sensor presence change (called from IRQ context).
+        Presence-change IRQ: flag the channel for the main loop.
 
-        Args:
-            channel: Channel number (1 or 2)
-            present: True if sensor connected, False if disconnected
+        Runs in IRQ context — one dict lookup and one bit set, no
+        allocation and no I2C; check_presence_changes does the work.
         """
-        # Set flag for main loop to handle (avoid I2C in IRQ context)
-        self._detect_pending[channel] = True
+        self._pending |= 1 << self._pin_to_channel[pin]
 
     def check_presence_changes(self):
         """
@@ -251,14 +389,20 @@ class PowerMeter:
         Call this periodically from the main loop.
 
         Returns:
-            Dict of channels that changed: {channel: sensor_type or None}
+            Dict of channels that changed: {channel: sensor_type or
+            None}. The no-change case returns a shared empty dict by
+            reference; do not mutate it.
         """
-        changes = {}
-
-        for channel in [1, 2]:
-            if self._detect_pending[channel]:
-                self._detect_pending[channel] = False
+        # Snapshot and test the bitmask first: the common no-change
+        # tick costs one integer compare and allocates nothing
+        pending = self._pending
+        if not pending:
+            return _EMPTY_DICT
+        self._pending = 0
 
+        changes = {}
+        for channel in (1, 2):
+            if pending & (1 << channel):
                 # Check current presence state
                 present = self._detect_pins[channel].value()
 
@@ -266,6 +410,7 @@ class PowerMeter:
                     # Sensor connected - detect and load calibration
                     sensor_type = self.cal_mgr.detect_sensor(channel)
                     self.channels[channel].clear_averaging()
+                    self.channels[channel].invalidate_cal()
                     changes[channel] = sensor_type
                     print("Sensor {} connected: {}".format(
                         channel, sensor_type or "unknown"))
@@ -273,6 +418,7 @@ class PowerMeter:
                     # Sensor disconnected - clear calibration data
                     self.cal_mgr.sensors[channel] = None
                     self.channels[channel].clear_averaging()
+                    self.channels[channel].invalidate_cal()
                     self.channels[channel].power_dbm = None
                     changes[channel] = None
                     print("Sensor {} disconnected".format(channel))
@@ -292,12 +438,54 @@ class PowerMeter:
         Returns:
             Dict mapping channel to sensor type (or None)
         """
-        return self.cal_mgr.detect_all_sensors()
+        results = self.cal_mgr.detect_all_sensors()
+        # Detection replaces the SensorCalibration objects
+        for channel in self.channels.values():
+            channel.invalidate_cal()
+        return results
 
     def get_channel(self, channel_num):
         """Get channel by number."""
         return self.channels.get(channel_num)
 
+    def publish_latest(self):
+        """Publish each channel's current reading to the shared arrays."""
+        powers = self._latest_power
+        unit_ids = self._latest_unit_id
+        for ch_num, channel in self.channels.items():
+            channel.publish_to(powers, unit_ids, ch_num - 1)
+
+    async def read_all_async(self):
+        """
+        Read both channels with overlapped ADC conversions.
+
+        Triggers both ADS1115 conversions back to back, awaits one
+        conversion time while they run in parallel on the chips, then
+        collects both results — one conversion delay per tick instead
+        of two, and the wait yields to other tasks instead of blocking.
+        """
+        adc1 = self.adc1
+        adc2 = self.adc2
+        # Free-running ADCs always have fresh data waiting; only the
+        # single-shot fallback needs a trigger and conversion wait
+        if not (adc1.continuous and adc2.continuous):
+            adc1.start_conversion()
+            adc2.start_conversion()
+
+            delay = adc1.conversion_ms
+            if adc2.conversion_ms > delay:
+                delay = adc2.conversion_ms
+            await asyncio.sleep_ms(delay)
+
+        ch1 = self.channels[1]
+        ch2 = self.channels[2]
+        v1 = adc1.read_result()
+        v2 = adc2.read_result()
+        ch1.power_voltage = v1
+        ch2.power_voltage = v2
+        ch1.power_dbm, ch2.power_dbm = self.cal_mgr.voltages_to_dbm_pair(
+            ch1._push_and_average(v1), ch2._push_and_average(v2))
+
     def read_all(self):
         """Read all channels once."""
         results = {}
@@ -322,11 +510,20 @@ class PowerMeter:
 
         self.running = True
 
-        while self.running:
-            for channel in self.channels.values():
-                channel.read_power()
+        # Hoist everything the loop touches into locals once; attribute
+        # lookup is among the costlier bytecodes and this loop runs for
+        # the life of the device. stop() zeroes the _run flag.
+        run = self._run
+        run[0] = 1
+        read_all = self.read_all_async
+        publish = self.publish_latest
+        sleep = asyncio.sleep_ms
+
+        while run[0]:
+            await read_all()
+            publish()
 
-            await asyncio.sleep_ms(interval_ms)
+            await sleep(interval_ms)
 
     def start(self, interval_ms=None):
         """Start continuous reading task."""
@@ -337,6 +534,7 @@ class PowerMeter:
     def stop(self):
         """Stop continuous reading task."""
         self.running = False
+        self._run[0] = 0
         if self._task:
             self._task.cancel()
             self._task = None
@@ -38,6 +38,12 @@ class TCA9548A:
         Returns:
             True if successful
         """
+        # The control register is write-only state we already track;
+        # re-selecting the current channel would just repeat the same
+        # byte on the bus
+        if channel == self._current_channel:
+            return True
+
         if channel is None:
             # Disable all channels
             self.i2c.writeto(self.address, bytes([0x00]))
@@ -83,9 +89,12 @@ class TCA9548A:
             Dict mapping channel number to list of addresses
         """
         results = {}
-        for ch in range(8):
-            devices = self.scan_channel(ch)
-            if devices:
-                results[ch] = devices
-        self.disable_all()
+        try:
+            for ch in range(8):
+                devices = self.scan_channel(ch)
+                if devices:
+                    results[ch] = devices
+        finally:
+            # Leave the bus sane even if a scan raises
+            self.disable_all()
         return results